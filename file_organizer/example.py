@@ -12,6 +12,16 @@ import tempfile
 import shutil
 from pathlib import Path
 
+from file_organizer import FileOrganizer, show_help
+
+def write_test_file(file_path, content):
+    """直接通过文件描述符写入测试文件，跳过文本/缓冲IO层的开销"""
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, content.encode('utf-8'))
+    finally:
+        os.close(fd)
+
 def create_test_environment():
     """创建测试环境，生成示例文件"""
     # 创建临时目录
@@ -55,13 +65,31 @@ def create_test_environment():
     
     # 创建测试文件
     for filename in test_files:
-        file_path = os.path.join(test_dir, filename)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(f"这是测试文件: {filename}")
+        write_test_file(os.path.join(test_dir, filename), f"这是测试文件: {filename}")
     
     print(f"创建了 {len(test_files)} 个测试文件")
     return test_dir
 
+def walk_entries(directory, level=1):
+    """
+    递归遍历目录，按名称顺序产出 (层级, os.DirEntry)
+    
+    直接使用 os.scandir 返回的目录项判断类型，不再额外调用 stat
+    """
+    with os.scandir(directory) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    for entry in entries:
+        yield level, entry
+        if entry.is_dir(follow_symlinks=False):
+            yield from walk_entries(entry.path, level + 1)
+
+def run_organizer(directory):
+    """在当前进程中整理指定目录，输出与命令行运行 file_organizer.py 相同"""
+    organizer = FileOrganizer(directory)
+    stats = organizer.organize_files()
+    organizer.print_statistics()
+    organizer.print_summary(stats)
+
 def demo_basic_usage():
     """演示基本使用方法"""
     print("\n" + "="*60)
@@ -77,16 +105,16 @@ def demo_basic_usage():
     
     # 运行 file_organizer
     print(f"\n运行 file_organizer.py...")
-    os.system(f"cd {test_dir} && python3 {os.path.join(os.path.dirname(__file__), 'file_organizer.py')}")
+    run_organizer(test_dir)
     
     print(f"\n整理后的目录结构:")
-    for root, dirs, files in os.walk(test_dir):
-        level = root.replace(test_dir, '').count(os.sep)
+    print(f"{os.path.basename(test_dir)}/")
+    for level, entry in walk_entries(test_dir):
         indent = ' ' * 2 * level
-        print(f"{indent}{os.path.basename(root)}/")
-        subindent = ' ' * 2 * (level + 1)
-        for file in files:
-            print(f"{subindent}{file}")
+        if entry.is_dir(follow_symlinks=False):
+            print(f"{indent}{entry.name}/")
+        else:
+            print(f"{indent}{entry.name}")
     
     # 清理
     shutil.rmtree(test_dir)
@@ -120,9 +148,7 @@ def demo_subtitle_intelligence():
     ]
     
     for filename in subtitle_files:
-        file_path = os.path.join(test_dir, filename)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(f"测试内容: {filename}")
+        write_test_file(os.path.join(test_dir, filename), f"测试内容: {filename}")
     
     print(f"\n字幕测试文件:")
     for file in sorted(subtitle_files):
@@ -130,17 +156,15 @@ def demo_subtitle_intelligence():
     
     # 运行整理
     print(f"\n运行字幕智能整理...")
-    os.system(f"cd {test_dir} && python3 {os.path.join(os.path.dirname(__file__), 'file_organizer.py')}")
+    run_organizer(test_dir)
     
     print(f"\n整理后的字幕分组:")
-    for root, dirs, files in os.walk(test_dir):
-        if root != test_dir:  # 只显示子目录
-            level = root.replace(test_dir, '').count(os.sep)
-            indent = ' ' * 2 * level
-            print(f"{indent}{os.path.basename(root)}/")
-            subindent = ' ' * 2 * (level + 1)
-            for file in sorted(files):
-                print(f"{subindent}{file}")
+    for level, entry in walk_entries(test_dir):
+        indent = ' ' * 2 * level
+        if entry.is_dir(follow_symlinks=False):
+            print(f"{indent}{entry.name}/")
+        elif level > 1:  # 只显示子目录中的文件
+            print(f"{indent}{entry.name}")
     
     # 清理
     shutil.rmtree(test_dir)
@@ -152,11 +176,9 @@ def demo_help_and_info():
     print("演示 3: 帮助信息和脚本信息")
     print("="*60)
     
-    script_path = os.path.join(os.path.dirname(__file__), 'file_organizer.py')
-    
     print("\n显示帮助信息:")
     print("-" * 40)
-    os.system(f"python3 {script_path} --help")
+    show_help()
 
 def demo_error_handling():
     """演示错误处理"""
@@ -164,16 +186,14 @@ def demo_error_handling():
     print("演示 4: 错误处理和边界情况")
     print("="*60)
     
-    script_path = os.path.join(os.path.dirname(__file__), 'file_organizer.py')
-    
     print("\n1. 测试不存在的目录:")
     print("-" * 30)
-    os.system(f"python3 {script_path} /nonexistent/directory")
+    run_organizer("/nonexistent/directory")
     
     print("\n2. 测试空目录:")
     print("-" * 30)
     empty_dir = tempfile.mkdtemp(prefix="empty_test_")
-    os.system(f"python3 {script_path} {empty_dir}")
+    run_organizer(empty_dir)
     shutil.rmtree(empty_dir)
 
 def main():
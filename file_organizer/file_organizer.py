@@ -8,27 +8,57 @@
 
 import os
 import sys
+import errno
 import argparse
 import shutil
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, Optional, Set
+
+
+# 常见的字幕文件语言/类型标识符
+_SUBTITLE_SUFFIXES = frozenset({
+    'ai', 'en', 'zh', 'cn', 'jp', 'kr', 'fr', 'de', 'es', 'it', 'ru',  # 语言代码
+    'gt', 'emb', 'asr', 'auto', 'forced', 'sdh', 'cc',  # 字幕类型
+    'chi', 'eng', 'jpn', 'kor', 'fre', 'ger', 'spa', 'ita', 'rus',  # 三字母语言代码
+    'chs', 'cht', 'simplified', 'traditional'  # 中文简繁体
+})
+
+# 字幕文件扩展名（.srt, .ass, .ssa, .vtt, .sub等）
+_SUBTITLE_EXTS = frozenset({'.srt', '.ass', '.ssa', '.vtt', '.sub', '.idx', '.sup'})
+
+# 标识符和扩展名的最大长度，超过该长度的候选无需转换小写即可排除
+_SUBTITLE_SUFFIX_MAX_LEN = max(map(len, _SUBTITLE_SUFFIXES))
+_SUBTITLE_EXT_MAX_LEN = max(map(len, _SUBTITLE_EXTS))
+
+# 并行移动文件的线程数（移动文件是I/O操作，线程在系统调用期间会释放GIL）
+_MAX_MOVE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
 class FileOrganizer:
     """文件整理器类"""
     
-    def __init__(self, target_directory: str = "."):
+    def __init__(self, target_directory: str = ".", dry_run: bool = False):
         """
         初始化文件整理器
         
         Args:
             target_directory: 目标目录路径，默认为当前目录
+            dry_run: 是否为预览模式，只计算分组结果，不创建目录也不移动文件
         """
         self.target_directory = Path(target_directory).resolve()
+        self.dry_run = dry_run
+        # 缓存字符串形式的路径，拼接路径时避免重复构造Path对象
+        self._target_str = str(self.target_directory)
+        # 预先编码的路径，移动文件时直接传给系统调用，避免每次重新编码（如中文文件名）
+        self._target_bytes = os.fsencode(self._target_str)
         self.total_files = 0
         self.organized_files = 0
         self.skipped_files = 0
         self.created_directories = []
+        # 每个目录中成功移入的文件数，用于统计输出，避免重新列目录
+        self._dir_counts: Dict[str, int] = {}
         
     def validate_directory(self) -> bool:
         """
@@ -51,7 +81,8 @@ class FileOrganizer:
             
         return True
     
-    def extract_base_name(self, filename: str) -> str:
+    @staticmethod
+    def extract_base_name(filename: str) -> str:
         """
         从文件名中提取基本名称，智能处理字幕文件和复杂文件名
         
@@ -73,31 +104,27 @@ class FileOrganizer:
             The.Salt.Path.2024.1080p.WEBRip.x265.10bit.AAC5.1-[YTS.MX].en.srt -> The.Salt.Path.2024.1080p.WEBRip.x265.10bit.AAC5.1-[YTS.MX]
             document.backup.pdf -> document.backup
         """
-        # 使用Path对象处理文件名
-        path = Path(filename)
-        base_name = path.stem  # 去除最后一个扩展名
-        
-        # 定义常见的字幕文件语言/类型标识符
-        subtitle_suffixes = {
-            'ai', 'en', 'zh', 'cn', 'jp', 'kr', 'fr', 'de', 'es', 'it', 'ru',  # 语言代码
-            'gt', 'emb', 'asr', 'auto', 'forced', 'sdh', 'cc',  # 字幕类型
-            'chi', 'eng', 'jpn', 'kor', 'fre', 'ger', 'spa', 'ita', 'rus',  # 三字母语言代码
-            'chs', 'cht', 'simplified', 'traditional'  # 中文简繁体
-        }
+        # 直接在字符串上查找点号位置去除最后一个扩展名，避免创建Path对象和中间列表
+        i = filename.rfind('.')
+        if i <= 0 or i == len(filename) - 1:
+            # 没有扩展名（包括隐藏文件和以点号结尾的文件名），保持原样
+            return filename
+        stem = filename[:i]
         
-        # 检查是否为字幕文件（.srt, .ass, .ssa, .vtt, .sub等）
-        if path.suffix.lower() in {'.srt', '.ass', '.ssa', '.vtt', '.sub', '.idx', '.sup'}:
-            # 对于字幕文件，尝试去除语言/类型标识符
-            parts = base_name.split('.')
-            if len(parts) > 1:
-                last_part = parts[-1].lower()
-                # 如果最后一部分是已知的字幕标识符，则去除它
-                if last_part in subtitle_suffixes:
-                    base_name = '.'.join(parts[:-1])
+        # 检查是否为字幕文件，对于字幕文件尝试去除语言/类型标识符
+        # 标识符都是较短的ASCII字符串，先按长度和ASCII快速排除，只对候选转换小写
+        if len(filename) - i <= _SUBTITLE_EXT_MAX_LEN and filename[i:].lower() in _SUBTITLE_EXTS:
+            j = stem.rfind('.')
+            tag = stem[j + 1:]
+            # 如果最后一部分是已知的字幕标识符，则去除它
+            if (j >= 0 and len(tag) <= _SUBTITLE_SUFFIX_MAX_LEN and tag.isascii()
+                    and tag.lower() in _SUBTITLE_SUFFIXES):
+                return stem[:j]
         
-        return base_name
+        return stem
     
-    def is_valid_base_name(self, base_name: str) -> bool:
+    @staticmethod
+    def is_valid_base_name(base_name: str) -> bool:
         """
         检查基本文件名是否有效
         
@@ -119,15 +146,16 @@ class FileOrganizer:
         Returns:
             bool: 成功返回True，否则返回False
         """
-        dir_path = self.target_directory / dir_name
+        dir_path = os.path.join(self._target_str, dir_name)
         
         try:
-            if not dir_path.exists():
-                dir_path.mkdir(parents=True, exist_ok=True)
-                self.created_directories.append(dir_name)
-                self.print_info(f"创建目录: {dir_name}/")
-                return True
-            elif not dir_path.is_dir():
+            # 直接创建目录，已存在时再检查类型，省去事先的exists()探测
+            os.mkdir(dir_path)
+            self.created_directories.append(dir_name)
+            self.print_info(f"创建目录: {dir_name}/")
+            return True
+        except FileExistsError:
+            if not os.path.isdir(dir_path):
                 self.print_error(f"'{dir_name}' 已存在但不是目录")
                 return False
             return True
@@ -138,38 +166,114 @@ class FileOrganizer:
             self.print_error(f"创建目录 '{dir_name}' 时发生错误: {e}")
             return False
     
-    def move_file_safely(self, source_file: Path, target_dir: str) -> bool:
+    def move_file_safely(self, source_name: str, source_path: str, target_dir: str,
+                         target_dir_path: bytes, existing_names: Optional[Set[bytes]],
+                         log: List[str]) -> bool:
         """
         安全地移动文件到目标目录
         
+        该方法会在工作线程中并行调用，因此不修改统计计数，也不直接打印，
+        输出信息追加到调用方提供的log列表中，由调用方统一输出
+        
         Args:
-            source_file: 源文件路径
+            source_name: 源文件名
+            source_path: 源文件路径
             target_dir: 目标目录名称
+            target_dir_path: 已编码的目标目录完整路径
+            existing_names: 本次新创建的目标目录中已移入的文件名集合，移动成功后追加；
+                为None时（目录原本就存在）每次移动前都检查目标文件是否存在
+            log: 输出缓冲列表
             
         Returns:
             bool: 成功返回True，否则返回False
         """
-        target_path = self.target_directory / target_dir / source_file.name
+        name_bytes = os.fsencode(source_name)
+        target_path = os.path.join(target_dir_path, name_bytes)
         
         try:
-            if target_path.exists():
-                self.print_warning(f"目标文件已存在，跳过: {source_file.name}")
-                self.skipped_files += 1
+            # 已有目录可能有大小写不同的同名文件（大小写不敏感的文件系统）或被其他进程写入，
+            # 必须实际检查；只有本次新创建的目录才能用内存中的集合判断
+            if existing_names is None:
+                exists = os.path.lexists(target_path)
+            else:
+                exists = name_bytes in existing_names
+            if exists:
+                log.append(f"警告: 目标文件已存在，跳过: {source_name}\n")
                 return False
-                
-            shutil.move(str(source_file), str(target_path))
-            print(f"  {source_file.name} -> {target_dir}/")
-            self.organized_files += 1
+            
+            # 同一文件系统内直接重命名，只有跨设备时才回退到shutil.move的复制+删除
+            try:
+                os.rename(source_path, target_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(source_path, os.fsdecode(target_path))
+            if existing_names is not None:
+                existing_names.add(name_bytes)
+            log.append(f"  {source_name} -> {target_dir}/\n")
             return True
         except PermissionError:
-            self.print_error(f"没有权限移动文件 '{source_file.name}'")
-            self.skipped_files += 1
+            log.append(f"错误: 没有权限移动文件 '{source_name}'\n")
             return False
         except Exception as e:
-            self.print_error(f"移动文件 '{source_file.name}' 时发生错误: {e}")
-            self.skipped_files += 1
+            log.append(f"错误: 移动文件 '{source_name}' 时发生错误: {e}\n")
             return False
     
+    def move_group(self, target_dir: str, items: List[Tuple[str, str]],
+                   is_new_dir: bool) -> Tuple[int, List[str]]:
+        """
+        将同一组的文件移动到目标目录，在工作线程中执行
+        
+        Args:
+            target_dir: 目标目录名称
+            items: (文件名, 文件路径) 列表
+            is_new_dir: 目标目录是否为本次新创建的目录
+            
+        Returns:
+            Tuple[int, List[str]]: 成功移动的文件数和本组缓存的输出
+        """
+        log: List[str] = []
+        moved = 0
+        # 每组只编码一次目标目录路径
+        target_dir_path = os.path.join(self._target_bytes, os.fsencode(target_dir))
+        
+        # 新创建的目录开始时为空，只需在内存中记录本组已移入的文件名；
+        # 已有目录在每次移动前逐个检查目标文件是否存在
+        existing_names: Optional[Set[bytes]] = set() if is_new_dir else None
+        
+        for source_name, source_path in items:
+            if self.move_file_safely(source_name, source_path, target_dir,
+                                     target_dir_path, existing_names, log):
+                moved += 1
+        return moved, log
+    
+    def move_groups(self, buckets: Dict[str, List[Tuple[str, str]]]):
+        """
+        为每组文件创建目录并移动文件
+        
+        Args:
+            buckets: 基本文件名 -> (文件名, 文件路径) 列表
+        """
+        # 每组只创建一次目录（串行执行，开销很小，且避免并发创建时的竞争）
+        groups = []
+        for base_name, items in buckets.items():
+            created_count = len(self.created_directories)
+            if self.create_directory_if_needed(base_name):
+                is_new_dir = len(self.created_directories) > created_count
+                groups.append((base_name, items, is_new_dir))
+            else:
+                self.skipped_files += len(items)
+        
+        # 按组并行移动文件，结果和输出在主线程中按组汇总，每组只写一次标准输出
+        if groups:
+            with ThreadPoolExecutor(max_workers=_MAX_MOVE_WORKERS) as executor:
+                results = executor.map(self.move_group, *zip(*groups))
+                for (base_name, items, _), (moved, log) in zip(groups, results):
+                    self._dir_counts[base_name] = moved
+                    self.organized_files += moved
+                    self.skipped_files += len(items) - moved
+                    sys.stdout.write(''.join(log))
+    
     def organize_files(self) -> Dict[str, int]:
         """
         整理目录中的文件
@@ -182,11 +286,24 @@ class FileOrganizer:
         
         self.print_info(f"开始整理目录: {self.target_directory}")
         
-        # 获取所有文件（不包括目录）
-        files = [f for f in self.target_directory.iterdir() 
-                if f.is_file() and not f.name.startswith('.')]
-        
-        self.total_files = len(files)
+        # 逐个消费scandir目录项并直接按基本文件名分组，不预先生成完整的文件列表
+        # 使用scandir复用目录项中的文件类型，避免逐个stat；先用廉价的首字符比较排除隐藏文件
+        buckets: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        invalid_files = []
+        extract_base_name = FileOrganizer.extract_base_name
+        is_valid_base_name = FileOrganizer.is_valid_base_name
+        with os.scandir(self.target_directory) as it:
+            for entry in it:
+                file_name = entry.name
+                if file_name[0] == '.' or not entry.is_file():
+                    continue
+                
+                self.total_files += 1
+                base_name = extract_base_name(file_name)
+                if is_valid_base_name(base_name):
+                    buckets[base_name].append((file_name, entry.path))
+                else:
+                    invalid_files.append(file_name)
         
         if self.total_files == 0:
             self.print_warning("目录中没有找到需要整理的文件")
@@ -194,20 +311,19 @@ class FileOrganizer:
         
         print(f"找到 {self.total_files} 个文件需要整理")
         
-        # 按基本文件名分组处理文件
-        for file_path in files:
-            base_name = self.extract_base_name(file_path.name)
-            
-            if not self.is_valid_base_name(base_name):
-                self.print_warning(f"跳过无效文件名: {file_path.name}")
-                self.skipped_files += 1
-                continue
-            
-            # 创建目录并移动文件
-            if self.create_directory_if_needed(base_name):
-                self.move_file_safely(file_path, base_name)
-            else:
-                self.skipped_files += 1
+        for file_name in invalid_files:
+            self.print_warning(f"跳过无效文件名: {file_name}")
+            self.skipped_files += 1
+        
+        if self.dry_run:
+            # 预览模式：只输出分组结果，不执行任何创建目录或移动文件的系统调用
+            log = []
+            for base_name, items in buckets.items():
+                log.extend(f"  [预览] {file_name} -> {base_name}/\n" for file_name, _ in items)
+                self.organized_files += len(items)
+            sys.stdout.write(''.join(log))
+        else:
+            self.move_groups(buckets)
         
         return {
             "total": self.total_files,
@@ -227,10 +343,18 @@ class FileOrganizer:
             print(f"  创建的目录数: {len(self.created_directories)}")
             print("  创建的目录:")
             for dir_name in self.created_directories:
-                dir_path = self.target_directory / dir_name
-                if dir_path.exists():
-                    file_count = len([f for f in dir_path.iterdir() if f.is_file()])
-                    print(f"    {dir_name}/ (包含 {file_count} 个文件)")
+                print(f"    {dir_name}/ (包含 {self._dir_counts.get(dir_name, 0)} 个文件)")
+    
+    def print_summary(self, stats: Dict[str, int]):
+        """根据整理结果打印一行总结"""
+        if stats["organized"] > 0 and self.dry_run:
+            self.print_info(f"\n[预览] 将整理 {stats['organized']} 个文件，未实际移动任何文件。")
+        elif stats["organized"] > 0:
+            self.print_success(f"\n成功整理了 {stats['organized']} 个文件！")
+        elif stats["total"] == 0:
+            self.print_info("\n没有找到需要整理的文件。")
+        else:
+            self.print_warning(f"\n所有 {stats['total']} 个文件都被跳过了。")
     
     @staticmethod
     def print_success(message: str):
@@ -269,11 +393,13 @@ def show_help():
     目标目录    要整理的目录路径（可选，默认为当前目录）
 
 选项:
+    --dry-run   预览模式：只显示分组结果，不实际创建目录或移动文件
     -h, --help  显示此帮助信息
 
 示例:
     python file_organizer.py                    # 整理当前目录
     python file_organizer.py /path/to/files     # 整理指定目录
+    python file_organizer.py --dry-run          # 预览当前目录的整理结果
     python file_organizer.py --help             # 显示帮助信息
 
 注意事项:
@@ -286,8 +412,8 @@ def show_help():
     print(help_text)
 
 
-def main():
-    """主函数"""
+def build_parser() -> argparse.ArgumentParser:
+    """构造命令行参数解析器"""
     parser = argparse.ArgumentParser(
         description="文件整理脚本 - 按文件名将文件分类到对应目录",
         add_help=False  # 禁用默认的-h选项，使用自定义的帮助
@@ -300,30 +426,45 @@ def main():
         help='要整理的目录路径（默认为当前目录）'
     )
     
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='预览模式：只显示分组结果，不实际创建目录或移动文件'
+    )
+    
     parser.add_argument(
         '-h', '--help',
         action='store_true',
         help='显示帮助信息'
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """主函数"""
+    argv = sys.argv[1:]
     
-    if args.help:
-        show_help()
-        return
+    # 最常见的调用方式（不带参数或只指定一个目录）无需构造argparse解析器
+    if not argv or (len(argv) == 1 and not argv[0].startswith('-')):
+        directory = argv[0] if argv else '.'
+        dry_run = False
+    else:
+        args = build_parser().parse_args(argv)
+        
+        if args.help:
+            show_help()
+            return
+        
+        directory = args.directory
+        dry_run = args.dry_run
     
     organizer = None
     try:
-        organizer = FileOrganizer(args.directory)
+        organizer = FileOrganizer(directory, dry_run=dry_run)
         stats = organizer.organize_files()
         organizer.print_statistics()
-        
-        if stats["organized"] > 0:
-            organizer.print_success(f"\n成功整理了 {stats['organized']} 个文件！")
-        elif stats["total"] == 0:
-            organizer.print_info("\n没有找到需要整理的文件。")
-        else:
-            organizer.print_warning(f"\n所有 {stats['total']} 个文件都被跳过了。")
+        organizer.print_summary(stats)
             
     except KeyboardInterrupt:
         if organizer:
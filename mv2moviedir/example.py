@@ -36,6 +36,14 @@ def show_usage():
     print("   - 建议格式: Movie.Name.YYYY.Resolution.Source.Codec.ext")
     print("   - 示例: The.Matrix.1999.1080p.BluRay.x264.mkv")
 
+def write_test_file(file_path, content):
+    """直接通过文件描述符写入测试文件，跳过文本/缓冲IO层的开销"""
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, content.encode('utf-8'))
+    finally:
+        os.close(fd)
+
 def create_test_environment():
     """创建测试环境"""
     print("创建测试环境...")
@@ -60,8 +68,7 @@ def create_test_environment():
     
     for filename in test_files:
         filepath = os.path.join(source_dir, filename)
-        with open(filepath, 'w') as f:
-            f.write(f"# 测试文件: {filename}\n")
+        write_test_file(filepath, f"# 测试文件: {filename}\n")
     
     print(f"测试环境已创建在: {test_dir}/")
     print(f"源文件目录: {source_dir}/")
@@ -21,6 +21,7 @@ mv2moviedir - 将电影文件移动到按电影名组织的目录结构中
     --remove-source       移动文件后删除源目录（如果源目录为空或只剩下nfo、txt、jpg等文件）
     --force               强制处理所有视频文件，忽略AI字幕检查（默认只处理有AI字幕的文件）
     --no-override         不覆盖已存在的目标文件（默认会覆盖已存在的文件）
+    --jobs=<线程数>       并行移动视频文件的线程数（1表示按顺序移动）
 
 示例：
     mv2moviedir.py /downloads /media/movies
@@ -33,9 +34,25 @@ mv2moviedir - 将电影文件移动到按电影名组织的目录结构中
 import os
 import sys
 import re
+import errno
 import shutil
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# 可选依赖：安装 google-re2 后，热点模式使用 re2 编译以保证线性时间匹配
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# 名称解析结果缓存的最大条目数
+# 同一文件名在移动、字幕匹配和清理源目录时会被反复解析
+NAME_CACHE_SIZE = 8192
+
+# 并行移动视频文件的默认线程数，移动以系统调用和IO等待为主
+MAX_MOVE_JOBS = min(32, (os.cpu_count() or 1) * 4)
 
 # 配置日志
 logging.basicConfig(
@@ -43,17 +60,42 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-# 支持的视频和字幕文件扩展名
-VIDEO_EXTENSIONS = ('.mkv', '.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm')
-SUBTITLE_EXTENSIONS = ('.srt', '.ass', '.sub', '.vtt', '.ssa')
-SUPPORTED_EXTENSIONS = VIDEO_EXTENSIONS + SUBTITLE_EXTENSIONS
+# 支持的视频和字幕文件扩展名（均为小写，与小写后的扩展名比较）
+VIDEO_EXTENSIONS = frozenset(('.mkv', '.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm'))
+SUBTITLE_EXTENSIONS = frozenset(('.srt', '.ass', '.sub', '.vtt', '.ssa'))
+SUPPORTED_EXTENSIONS = VIDEO_EXTENSIONS | SUBTITLE_EXTENSIONS
+
+# 视频扩展名元组，供 str.endswith 快速判断
+VIDEO_SUFFIXES = tuple(VIDEO_EXTENSIONS)
 
 # 不需要删除的文件类型（在源目录中保留的文件类型）
-IGNORED_EXTENSIONS = ('.nfo', '.txt', '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff')
+IGNORED_EXTENSIONS = frozenset(('.nfo', '.txt', '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff'))
+
+# re2 的 \s 只匹配 ASCII 空白，补充为与标准库 re 相同的 Unicode 空白字符集
+RE2_WHITESPACE_CLASS = r'\s\x0b\x1c-\x1f\x85\p{Z}'
+
+
+def compile_linear_pattern(pattern):
+    """
+    编译不含前瞻、反向引用等特性的正则表达式
+    
+    已安装 re2 时使用 re2 编译，保证线性时间匹配；否则使用标准库 re。
+    模式中的 \\s 只能出现在字符类中
+    
+    Args:
+        pattern: 正则表达式字符串
+        
+    Returns:
+        编译后的模式对象，re2 与 re 的 search/match 接口一致
+    """
+    if re2 is not None:
+        return re2.compile(pattern.replace(r'\s', RE2_WHITESPACE_CLASS))
+    return re.compile(pattern)
+
 
 # 正则表达式模式
-# 电视剧模式（包含SxxExx格式）- 用于排除电视剧文件
-TV_SHOW_PATTERN = re.compile(r'[.\s\(\)\[\]][Ss][0-9]{1,2}[Ee][0-9]{1,2}[.\s\(\)\[\]]')
+# 电视剧模式（包含SxxExx格式）- 用于排除电视剧文件，对每个文件名都会执行
+TV_SHOW_PATTERN = compile_linear_pattern(r'[.\s\(\)\[\]][Ss][0-9]{1,2}[Ee][0-9]{1,2}[.\s\(\)\[\]]')
 
 # 年份模式：匹配1900-2099年，更智能的匹配
 # 优先匹配位于特定位置的年份，避免误识别电影名称中的年份
@@ -74,6 +116,18 @@ RELEASE_YEAR_PATTERNS = [
     re.compile(r'[.\s](19[0-9]{2}|20[0-9]{2})[.\s]*$')
 ]
 
+# 发行年份的组合模式：按上面的优先级排列各分支，一次扫描即可找出优先级最高的模式的最左匹配。
+# 各分支放在零宽前瞻中，匹配不消耗字符；同一位置只记录优先级最高的分支，
+# 被遮挡的低优先级分支不会成为最终结果
+RELEASE_YEAR_GROUPS = tuple('release_year%d' % index for index in range(len(RELEASE_YEAR_PATTERNS)))
+RELEASE_YEAR_PATTERN = re.compile(
+    '(?=' + '|'.join(
+        '(?P<%s>%s)' % (name, pattern.pattern)
+        for name, pattern in zip(RELEASE_YEAR_GROUPS, RELEASE_YEAR_PATTERNS)
+    ) + ')',
+    re.IGNORECASE
+)
+
 # 分辨率模式（支持更多分辨率）
 RESOLUTION_PATTERN = re.compile(r'[.\s\(\)\[\]](\d+p|4K|8K|UHD|HD)(?=[.\s\(\)\[\]]|$)', re.IGNORECASE)
 
@@ -83,13 +137,69 @@ CODEC_PATTERN = re.compile(r'[.\s\(\)\[\]](x26[45]|H\.?26[45]|AVC|HEVC|VP9|AV1)[
 # 用于替换文件名中的分隔符的模式
 SEPARATOR_PATTERN = re.compile(r'[\s\(\)\[\]]')
 
+# 连续的点号
+MULTI_DOT_PATTERN = re.compile(r'\.{2,}')
+
+# 文件系统不兼容的特殊字符，统一替换为点号
+UNSAFE_CHAR_TABLE = str.maketrans(dict.fromkeys(':/\\|?*<>"', '.'))
+
+# 发行组织的 -[GROUP] 格式
+RELEASE_GROUP_BRACKET_PATTERN = re.compile(r'-\[([^\]]+)\]')
+
+# 末尾以空格分隔的发行组织（支持发行组织后面跟字幕标识，如.ai.srt）
+RELEASE_GROUP_END_PATTERN = re.compile(r'\s+([A-Z0-9]{2,}(?:\.[A-Z0-9]+)*)(?=\.ai\.srt$|$)')
+
+# 名称规整结果为空时，用于从原始名称中去除非字母数字和基本符号的字符
+NON_NAME_CHAR_PATTERN = re.compile(r'[^\w\-.]')
+
+# 中文字符
+CHINESE_CHAR_PATTERN = re.compile(r'[\u4e00-\u9fff]')
+
+# 英文电影名称：以英文字母开头的连续英文内容
+ENGLISH_NAME_PATTERN = re.compile(r'[A-Za-z][A-Za-z0-9\s\-\.]+(?:\d{4})?[A-Za-z0-9\s\-\.]*')
+
+# 常见的网址和广告模式，这些不是电影名称
+AD_PATTERNS = [
+    re.compile(r'www\.[a-zA-Z0-9.-]+', re.IGNORECASE),  # 网址
+    re.compile(r'[a-zA-Z0-9.-]+\.com', re.IGNORECASE),  # .com域名
+    re.compile(r'[a-zA-Z0-9.-]+\.net', re.IGNORECASE),  # .net域名
+    re.compile(r'[a-zA-Z0-9.-]+\.org', re.IGNORECASE),  # .org域名
+]
+
+# 广告模式的组合：只需判断是否包含任一广告内容时，一次扫描代替逐个模式查找
+AD_PATTERN = re.compile('|'.join(ad_pattern.pattern for ad_pattern in AD_PATTERNS), re.IGNORECASE)
+
+# 位于名称末尾的年份（包括没有分隔符的情况）
+END_YEAR_PATTERN = re.compile(r'(19[0-9]{2}|20[0-9]{2})$')
+
+# 整个名称就是年份
+FULL_YEAR_PATTERN = re.compile(r'^(19[0-9]{2}|20[0-9]{2})$')
+
+# 只包含分隔符
+SEPARATORS_ONLY_PATTERN = re.compile(r'^[.\s\(\)\[\]]*$')
+
 # 常见的电影质量标识符
 QUALITY_PATTERNS = [
-    r'[.\s\(\)\[\]](BluRay|BDRip|BRRip|DVDRip|WEBRip|WEB-DL|HDRip|CAMRip|TS|TC)[.\s\(\)\[\]]',
-    r'[.\s\(\)\[\]](REMUX|REPACK|PROPER|REAL)[.\s\(\)\[\]]',
-    r'[.\s\(\)\[\]](HDR|HDR10|DV|Dolby\.?Vision)[.\s\(\)\[\]]'
+    re.compile(r'[.\s\(\)\[\]](BluRay|BDRip|BRRip|DVDRip|WEBRip|WEB-DL|HDRip|CAMRip|TS|TC)[.\s\(\)\[\]]', re.IGNORECASE),
+    re.compile(r'[.\s\(\)\[\]](REMUX|REPACK|PROPER|REAL)[.\s\(\)\[\]]', re.IGNORECASE),
+    re.compile(r'[.\s\(\)\[\]](HDR|HDR10|DV|Dolby\.?Vision)[.\s\(\)\[\]]', re.IGNORECASE)
 ]
 
+# 没有发行年份时用于确定截断点的组合模式：一次扫描同时记录分辨率、质量标识符、
+# 编码和年份的首次出现位置。各分支都放在零宽前瞻中，匹配不会消耗字符，
+# 相邻或重叠的标识（如 .REMUX.BluRay.）仍能各自被找到
+NAME_END_GROUPS = ('resolution', 'quality0', 'quality1', 'quality2', 'codec')
+NAME_END_PATTERN = re.compile(
+    '(?=' + '|'.join(
+        '(?P<%s>%s)' % (name, pattern.pattern)
+        for name, pattern in zip(
+            NAME_END_GROUPS + ('year',),
+            (RESOLUTION_PATTERN, *QUALITY_PATTERNS, CODEC_PATTERN, YEAR_PATTERN)
+        )
+    ) + ')',
+    re.IGNORECASE
+)
+
 # 常见的发布组标识符
 RELEASE_GROUP_PATTERN = re.compile(r'-([A-Z0-9]+)$|[\[\(]([A-Z0-9]+)[\]\)]$')
 
@@ -121,7 +231,7 @@ def contains_restricted_keywords(filename):
     filename_lower = filename.lower()
     for keyword in RESTRICTED_KEYWORDS:
         if keyword.lower() in filename_lower:
-            logging.info(f"检测到受限制关键词 '{keyword}' 在文件: {filename}")
+            logging.info("检测到受限制关键词 '%s' 在文件: %s", keyword, filename)
             return True
     return False
 
@@ -136,9 +246,13 @@ def is_movie(filename):
     Returns:
         bool: 是否为电影
     """
-    # 检查文件扩展名
-    _, ext = os.path.splitext(filename)
-    if ext.lower() not in VIDEO_EXTENSIONS:
+    # 先用 endswith 快速排除非视频文件（目录中的大多数文件）
+    lower_filename = filename.lower()
+    if not lower_filename.endswith(VIDEO_SUFFIXES):
+        return False
+    
+    # 排除只有扩展名的隐藏文件（如 .mkv），与 splitext 的判断保持一致
+    if not os.path.splitext(lower_filename)[1]:
         return False
     
     # 如果包含电视剧格式，则不是电影
@@ -187,6 +301,7 @@ def match_resolution_and_codec(filename, target_resolution=None, target_codec=No
     return True
 
 
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def normalize_name(name):
     """
     统一的名称规整函数：用于文件名和目录名的标准化处理
@@ -203,37 +318,24 @@ def normalize_name(name):
     original_name = name
     
     # 检测并处理发行组织的特殊格式
-    # 1. 处理 -[GROUP] 格式：保留减号，移除方括号
-    release_group_bracket_pattern = re.compile(r'-\[([^\]]+)\]')
-    if release_group_bracket_pattern.search(name):
-        name = release_group_bracket_pattern.sub(r'-\1', name)
+    # 1. 处理 -[GROUP] 格式：保留减号，移除方括号（没有匹配时 sub 原样返回）
+    name = RELEASE_GROUP_BRACKET_PATTERN.sub(r'-\1', name)
     
     # 2. 检测末尾的发行组织（通常是大写字母和数字的组合）
     # 如果末尾是空格+发行组织，将空格替换为减号
     # 支持发行组织后面跟字幕标识（如.ai.srt）的情况
-    release_group_end_pattern = re.compile(r'\s+([A-Z0-9]{2,}(?:\.[A-Z0-9]+)*)(?=\.ai\.srt$|$)')
-    match = release_group_end_pattern.search(name)
-    if match:
-        # 将末尾的空格+发行组织替换为减号+发行组织
-        name = release_group_end_pattern.sub(r'-\1', name)
+    # 将末尾的空格+发行组织替换为减号+发行组织
+    name = RELEASE_GROUP_END_PATTERN.sub(r'-\1', name)
     
     # 替换空格、()、剩余的[]为点号
     # 注意：这里使用修改后的模式，因为我们已经处理了发行组织的方括号
-    separator_pattern = re.compile(r'[\s\(\)\[\]]')
-    normalized = separator_pattern.sub('.', name)
-    
-    # 处理可能出现的连续点号
-    while '..' in normalized:
-        normalized = normalized.replace('..', '.')
+    normalized = SEPARATOR_PATTERN.sub('.', name)
     
     # 替换文件系统不兼容的特殊字符
-    file_system_unsafe = [':', '/', '\\', '|', '?', '*', '<', '>', '"']
-    for char in file_system_unsafe:
-        normalized = normalized.replace(char, '.')
+    normalized = normalized.translate(UNSAFE_CHAR_TABLE)
     
-    # 再次处理可能因替换产生的连续点号
-    while '..' in normalized:
-        normalized = normalized.replace('..', '.')
+    # 合并替换产生的连续点号
+    normalized = MULTI_DOT_PATTERN.sub('.', normalized)
     
     # 去除开头和结尾的点号
     normalized = normalized.strip('.')
@@ -241,13 +343,14 @@ def normalize_name(name):
     # 如果结果为空，返回原始名称的简化版本
     if not normalized:
         # 只保留字母数字和基本符号
-        normalized = re.sub(r'[^\w\-.]', '', original_name)
+        normalized = NON_NAME_CHAR_PATTERN.sub('', original_name)
         if not normalized:
             normalized = "Unknown"
     
     return normalized
 
 
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def remove_chinese_ads(filename):
     """
     去除文件名前面的中文广告内容，保留英文电影名称
@@ -258,22 +361,15 @@ def remove_chinese_ads(filename):
     Returns:
         str: 去除中文广告内容后的文件名
     """
-    # 常见的网址和广告模式，这些不是电影名称
-    ad_patterns = [
-        r'www\.[a-zA-Z0-9.-]+',  # 网址
-        r'[a-zA-Z0-9.-]+\.com',  # .com域名
-        r'[a-zA-Z0-9.-]+\.net',  # .net域名
-        r'[a-zA-Z0-9.-]+\.org',  # .org域名
-    ]
-    
     # 检查是否包含中文字符
-    if not re.search(r'[\u4e00-\u9fff]', filename):
+    if not CHINESE_CHAR_PATTERN.search(filename):
         # 如果没有中文字符，检查是否有明显的广告内容
-        for ad_pattern in ad_patterns:
-            if re.search(ad_pattern, filename, re.IGNORECASE):
-                # 找到广告内容，尝试从广告后开始
-                match = re.search(ad_pattern, filename, re.IGNORECASE)
+        # 大多数文件名不含广告，先用组合模式一次扫描排除，有广告时再按模式顺序确定广告位置
+        if AD_PATTERN.search(filename):
+            for ad_pattern in AD_PATTERNS:
+                match = ad_pattern.search(filename)
                 if match:
+                    # 找到广告内容，尝试从广告后开始
                     after_ad = filename[match.end():].lstrip('. ')
                     if len(after_ad) >= 3:
                         return after_ad
@@ -283,17 +379,13 @@ def remove_chinese_ads(filename):
     
     # 如果包含中文字符，查找第一个英文电影名称
     # 匹配英文电影名称模式：以英文字母开头的连续英文内容
-    english_match = re.search(r'[A-Za-z][A-Za-z0-9\s\-\.]+(?:\d{4})?[A-Za-z0-9\s\-\.]*', filename)
+    english_match = ENGLISH_NAME_PATTERN.search(filename)
     
     if english_match:
         english_part = english_match.group().strip()
         
         # 检查是否是广告
-        is_ad = False
-        for ad_pattern in ad_patterns:
-            if re.search(ad_pattern, english_part, re.IGNORECASE):
-                is_ad = True
-                break
+        is_ad = AD_PATTERN.search(english_part) is not None
         
         if not is_ad and len(english_part) >= 3:
             return english_part
@@ -310,14 +402,33 @@ def extract_movie_info(filename):
         filename: 文件名
         
     Returns:
-        tuple: (电影名称, 年份) 或者 (电影名称, None) 如果无法提取年份
+        tuple: (电影名称, 年份, 规整后的文件名) 如果无法提取年份，年份为None；
+            规整后的文件名已去除扩展名和中文广告，可直接用作目录名和文件名
+    """
+    movie_name, year, normalized_basename = parse_movie_info(filename)
+    
+    if not movie_name:
+        logging.warning("无法从 %s 中提取电影名称", filename)
+    
+    return movie_name, year, normalized_basename
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def parse_movie_info(filename):
+    """
+    解析文件名中的电影名称和年份（结果按文件名缓存，不输出日志）
+    
+    Args:
+        filename: 文件名
+        
+    Returns:
+        tuple: (电影名称, 年份, 规整后的文件名)，无法提取电影名称时电影名称和年份为None
     """
     # 移除文件扩展名（只移除已知的视频和字幕扩展名）
     basename = filename
-    for ext in SUPPORTED_EXTENSIONS:
-        if filename.lower().endswith(ext.lower()):
-            basename = filename[:-len(ext)]
-            break
+    head, dot, ext = filename.rpartition('.')
+    if dot and (dot + ext).lower() in SUPPORTED_EXTENSIONS:
+        basename = head
     
     # 去除中文广告内容
     basename = remove_chinese_ads(basename)
@@ -330,79 +441,67 @@ def extract_movie_info(filename):
     year_match = None
     movie_name_end = len(normalized_basename)
     
-    # 按优先级尝试匹配年份模式
-    for pattern in RELEASE_YEAR_PATTERNS:
-        match = pattern.search(normalized_basename)
-        if match:
-            year_match = match
-            # 提取年份数字
-            if match.groups():
-                year = int(match.group(1))
-            else:
-                # 对于没有分组的模式，提取整个匹配中的年份
-                year_text = match.group(0)
-                year_digits = re.search(r'(19[0-9]{2}|20[0-9]{2})', year_text)
-                if year_digits:
-                    year = int(year_digits.group(1))
+    # 一次扫描记录各发行年份模式的首次匹配，遇到最高优先级的模式即可停止
+    first_matches = {}
+    for match in RELEASE_YEAR_PATTERN.finditer(normalized_basename):
+        first_matches.setdefault(match.lastgroup, match)
+        if match.lastgroup == RELEASE_YEAR_GROUPS[0]:
+            break
+    
+    # 按优先级选取年份，年份数字是各模式中的第一个分组
+    for name in RELEASE_YEAR_GROUPS:
+        if name in first_matches:
+            year_match = first_matches[name]
+            year = int(year_match.group(RELEASE_YEAR_PATTERN.groupindex[name] + 1))
+            # 年份在原始文件名中的位置，电影名称应该在年份之前结束
+            year_start = year_match.start(name)
             break
     
     # 如果使用严格模式找到了年份，确定电影名称的结束位置
     if year_match:
-        # 找到年份在原始文件名中的位置，电影名称应该在年份之前结束
-        year_start = year_match.start()
-        # 寻找年份前最近的分隔符位置
-        for i in range(year_start, -1, -1):
-            if normalized_basename[i] in '.[]()':
-                movie_name_end = i
-                break
-        else:
+        # 寻找年份前最近的分隔符位置（包括年份匹配起始位置本身），每种分隔符用一次 rfind 查找
+        movie_name_end = max(normalized_basename.rfind(separator, 0, year_start + 1)
+                             for separator in '.[]()')
+        if movie_name_end < 0:
             movie_name_end = year_start
     else:
-        # 如果没有找到明确的发行年份，按优先级尝试截断
-        # 1. 首先尝试在分辨率之前截断
-        resolution_match = RESOLUTION_PATTERN.search(normalized_basename)
-        if resolution_match:
-            movie_name_end = resolution_match.start()
-        else:
-            # 2. 如果没有分辨率，尝试在质量标识符之前截断
-            for pattern in QUALITY_PATTERNS:
-                quality_match = re.search(pattern, normalized_basename, re.IGNORECASE)
-                if quality_match:
-                    movie_name_end = quality_match.start()
-                    break
-            
-            # 3. 如果没有质量标识符，尝试在编码之前截断
-            if movie_name_end == len(normalized_basename):
-                codec_match = CODEC_PATTERN.search(normalized_basename)
-                if codec_match:
-                    movie_name_end = codec_match.start()
+        # 如果没有找到明确的发行年份，一次扫描记录各类标识的首次匹配
+        first_matches = {}
+        for match in NAME_END_PATTERN.finditer(normalized_basename):
+            first_matches.setdefault(match.lastgroup, match)
         
-        # 如果仍然没有找到合适的截断点，使用旧的年份模式作为后备
-        if movie_name_end == len(normalized_basename):
-            fallback_year_match = YEAR_PATTERN.search(normalized_basename)
+        # 按优先级尝试截断：分辨率、质量标识符、编码
+        for name in NAME_END_GROUPS:
+            if name in first_matches:
+                movie_name_end = first_matches[name].start(name)
+                break
+        else:
+            # 如果没有找到合适的截断点，使用旧的年份模式作为后备
+            fallback_year_match = first_matches.get('year')
             if fallback_year_match:
                 # 检查这个年份是否可能是电影名称的一部分
-                year_pos = fallback_year_match.start()
+                year_pos = fallback_year_match.start('year')
+                year_end = fallback_year_match.end('year')
                 # 如果年份前后都有字母，可能是电影名称的一部分，不使用
                 before_year = normalized_basename[max(0, year_pos-2):year_pos]
-                after_year = normalized_basename[fallback_year_match.end():fallback_year_match.end()+2]
+                after_year = normalized_basename[year_end:year_end+2]
                 
                 # 如果年份前后不是纯分隔符，可能是电影名称的一部分
-                if not (re.match(r'^[.\s\(\)\[\]]*$', before_year) or 
-                       re.match(r'^[.\s\(\)\[\]]*$', after_year)):
+                if not (SEPARATORS_ONLY_PATTERN.match(before_year) or 
+                       SEPARATORS_ONLY_PATTERN.match(after_year)):
                     # 年份可能是电影名称的一部分，不截断
                     pass
                 else:
-                    year = int(fallback_year_match.group(1))
-                    movie_name_end = fallback_year_match.start()
+                    year = int(normalized_basename[year_pos+1:year_end])
+                    movie_name_end = year_pos
         
         # 最后尝试检查文件名末尾是否有年份（没有扩展名的情况）
         if year is None and movie_name_end == len(normalized_basename):
             # 检查文件名是否以年份结尾（包括没有分隔符的情况）
-            end_year_match = re.search(r'(19[0-9]{2}|20[0-9]{2})$', normalized_basename)
+            end_year_match = END_YEAR_PATTERN.search(normalized_basename)
             if not end_year_match:
                 # 检查整个文件名是否就是年份
-                end_year_match = re.match(r'^(19[0-9]{2}|20[0-9]{2})$', normalized_basename)
+                end_year_match = FULL_YEAR_PATTERN.match(normalized_basename)
             
             if end_year_match:
                 year = int(end_year_match.group(1))
@@ -427,30 +526,29 @@ def extract_movie_info(filename):
     movie_name = ' '.join(cleaned_parts).strip()
     
     if not movie_name:
-        logging.warning(f"无法从 {filename} 中提取电影名称")
-        return None, None
+        return None, None, normalized_basename
     
-    return movie_name, year
+    return movie_name, year, normalized_basename
 
 
-def has_ai_subtitle(video_file_path):
+def build_subtitle_name(normalized_video, video_basename, subtitle_basename):
     """
-    检查视频文件是否存在对应的.ai.srt字幕文件
+    根据对应视频规整后的名称生成字幕文件名（不含扩展名）
+    
+    只规整视频名之后的部分（如 .ai、.chs），原样接在规整后的视频名之后；
+    后缀不以分隔符开头时（如 Film2、Film-eng）不额外插入点号
     
     Args:
-        video_file_path: 视频文件的完整路径
+        normalized_video: 视频规整后的文件名（不含扩展名）
+        video_basename: 视频的原始文件名（不含扩展名），必须是字幕文件名的前缀
+        subtitle_basename: 字幕的原始文件名（不含扩展名）
         
     Returns:
-        bool: 如果存在对应的.ai.srt字幕文件返回True，否则返回False
+        str: 规整后的字幕文件名（不含扩展名）
     """
-    # 获取视频文件的目录和文件名（不含扩展名）
-    video_dir = os.path.dirname(video_file_path)
-    video_name = os.path.splitext(os.path.basename(video_file_path))[0]
-    
-    # 构造对应的.ai.srt字幕文件路径
-    ai_subtitle_path = os.path.join(video_dir, f"{video_name}.ai.srt")
-    
-    return os.path.exists(ai_subtitle_path)
+    subtitle_suffix = subtitle_basename[len(video_basename):]
+    subtitle_suffix = SEPARATOR_PATTERN.sub('.', subtitle_suffix).translate(UNSAFE_CHAR_TABLE)
+    return MULTI_DOT_PATTERN.sub('.', normalized_video + subtitle_suffix).rstrip('.')
 
 
 def check_directory_permissions(directory):
@@ -463,16 +561,23 @@ def check_directory_permissions(directory):
     Returns:
         bool: 如果有读写权限返回True，否则返回False
     """
-    if not os.path.exists(directory):
-        # 检查父目录的写权限
-        parent_dir = os.path.dirname(directory)
-        while parent_dir and not os.path.exists(parent_dir):
-            parent_dir = os.path.dirname(parent_dir)
-        return os.access(parent_dir, os.W_OK) if parent_dir else False
-    
-    return os.access(directory, os.R_OK | os.W_OK)
+    # 先转换为绝对路径，相对路径也能逐级找到已存在的祖先目录
+    directory = os.path.abspath(directory)
+    if os.path.isdir(directory):
+        return os.access(directory, os.R_OK | os.W_OK)
+    
+    # 目录不存在时，检查最近的已存在祖先目录的写权限
+    parent_dir = os.path.dirname(directory)
+    while not os.path.isdir(parent_dir):
+        next_parent = os.path.dirname(parent_dir)
+        if next_parent == parent_dir:
+            # 已到达根目录仍不存在
+            return False
+        parent_dir = next_parent
+    return os.access(parent_dir, os.W_OK)
 
 
+@lru_cache(maxsize=256)
 def get_year_category(year):
     """
     根据年份获取归类目录名
@@ -495,23 +600,49 @@ def get_year_category(year):
         return f"{decade}s"
 
 
-def create_target_directory(base_dir, filename_without_ext, year=None, year_group=False):
+def ensure_directory(directory, known_dirs=None):
+    """
+    确保目录存在：直接尝试创建，已存在时忽略，不需要先检查目录是否存在
+    
+    Args:
+        directory: 目录路径
+        known_dirs: 已确认存在的目录集合（可选），集合中的目录不再访问文件系统，
+            确认后的目录会加入集合
+        
+    Returns:
+        bool: 是否新创建了目录
+        
+    Raises:
+        OSError: 无法创建目录
+    """
+    if known_dirs is not None and directory in known_dirs:
+        return False
+    
+    try:
+        os.makedirs(directory)
+        created = True
+    except FileExistsError:
+        created = False
+    
+    if known_dirs is not None:
+        known_dirs.add(directory)
+    return created
+
+
+def create_target_directory(base_dir, movie_dir_name, year=None, year_group=False, known_dirs=None):
     """
     创建目标目录结构
     
     Args:
         base_dir: 基础目录
-        filename_without_ext: 完整的文件名（不含扩展名）
+        movie_dir_name: 电影目录名，即去除中文广告并规整后的完整文件名（不含扩展名，保留所有视频信息）
         year: 年份（可选）
         year_group: 是否按年份分组
+        known_dirs: 已确认存在的目录集合（可选），用于跳过重复的创建
         
     Returns:
         str: 创建的目标目录路径，如果创建失败返回None
     """
-    # 先去除中文广告内容，然后规整完整文件名作为目录名（保留所有视频信息）
-    cleaned_filename = remove_chinese_ads(filename_without_ext)
-    movie_dir_name = normalize_name(cleaned_filename)
-    
     # 确定目标路径
     if year_group:
         # 按年份分组：base_dir/年份归类/完整文件名/
@@ -520,57 +651,88 @@ def create_target_directory(base_dir, filename_without_ext, year=None, year_grou
         target_dir = os.path.join(year_dir, movie_dir_name)
         
         # 创建年份归类目录
-        if not os.path.exists(year_dir):
-            try:
-                os.makedirs(year_dir)
-                logging.info(f"创建年份归类目录: {year_dir}")
-            except (PermissionError, OSError) as e:
-                logging.error(f"无法创建年份归类目录 {year_dir}: {e}")
-                return None
+        try:
+            if ensure_directory(year_dir, known_dirs):
+                logging.info("创建年份归类目录: %s", year_dir)
+        except (PermissionError, OSError) as e:
+            logging.error("无法创建年份归类目录 %s: %s", year_dir, e)
+            return None
     else:
         # 直接在基础目录下：base_dir/完整文件名/
         target_dir = os.path.join(base_dir, movie_dir_name)
     
     # 创建电影目录
-    if not os.path.exists(target_dir):
-        try:
-            os.makedirs(target_dir)
-            logging.info(f"创建电影目录: {target_dir}")
-        except (PermissionError, OSError) as e:
-            logging.error(f"无法创建电影目录 {target_dir}: {e}")
-            return None
+    try:
+        if ensure_directory(target_dir, known_dirs):
+            logging.info("创建电影目录: %s", target_dir)
+    except (PermissionError, OSError) as e:
+        logging.error("无法创建电影目录 %s: %s", target_dir, e)
+        return None
     
     return target_dir
 
 
-def contains_tv_show_files_in_directory_only(directory):
+def contains_tv_show_files_in_directory_only(directory, filenames):
     """
     检查单个目录（不递归）是否包含电视剧文件
     
     Args:
         directory: 目录路径
+        filenames: 遍历时读取的目录中的文件名列表
         
     Returns:
         bool: 是否包含电视剧文件
     """
-    if not os.path.exists(directory) or not os.path.isdir(directory):
-        return False
+    for filename in filenames:
+        ext = os.path.splitext(filename)[1].lower()
+        if ext in VIDEO_EXTENSIONS and TV_SHOW_PATTERN.search(filename):
+            logging.info("发现电视剧文件: %s", os.path.join(directory, filename))
+            return True
+    return False
+
+
+def iter_directory_entries(directory, parent_dirs=None):
+    """
+    使用os.scandir自底向上遍历目录树，遍历顺序与os.walk(topdown=False)一致
     
+    目录项的类型直接来自readdir返回的结果，不需要对每个文件额外调用stat。
+    隐藏目录（如NAS上的 .Trash、.@__thumb）不包含待整理的电影，不进入遍历
+    
+    Args:
+        directory: 根目录路径
+        parent_dirs: 可选的字典，遍历时记录每个子目录的父目录 {子目录路径: 父目录路径}
+        
+    Yields:
+        tuple: (目录路径, 该目录下非目录项的DirEntry列表)
+    """
     try:
-        # 只检查当前目录中的文件，不递归检查子目录
-        for filename in os.listdir(directory):
-            file_path = os.path.join(directory, filename)
-            if os.path.isfile(file_path):
-                _, ext = os.path.splitext(filename)
-                if ext.lower() in VIDEO_EXTENSIONS:
-                    # 检查是否是电视剧文件
-                    if TV_SHOW_PATTERN.search(filename):
-                        logging.info(f"发现电视剧文件: {file_path}")
-                        return True
-        return False
-    except Exception as e:
-        logging.warning(f"检查目录时出错: {directory}, 错误: {e}")
-        return False
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        # 与os.walk一致，无法读取的目录直接跳过
+        return
+    
+    files = []
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        
+        if is_dir:
+            # 与os.walk(followlinks=False)一致，不进入符号链接指向的目录
+            if not entry.is_symlink() and not entry.name.startswith('.'):
+                subdirs.append(entry.path)
+        else:
+            files.append(entry)
+    
+    for subdir in subdirs:
+        if parent_dirs is not None:
+            parent_dirs[subdir] = directory
+        yield from iter_directory_entries(subdir, parent_dirs)
+    
+    yield directory, files
 
 
 def contains_tv_show_files(directory):
@@ -583,135 +745,133 @@ def contains_tv_show_files(directory):
     Returns:
         bool: 是否包含电视剧文件
     """
-    if not os.path.exists(directory) or not os.path.isdir(directory):
+    if not os.path.isdir(directory):
         return False
     
     try:
         # 递归检查目录及其子目录中的所有文件
         for root, _, files in os.walk(directory):
             for filename in files:
-                _, ext = os.path.splitext(filename)
-                if ext.lower() in VIDEO_EXTENSIONS:
+                ext = os.path.splitext(filename)[1].lower()
+                if ext in VIDEO_EXTENSIONS:
                     # 检查是否是电视剧文件
                     if TV_SHOW_PATTERN.search(filename):
-                        logging.info(f"发现电视剧文件: {os.path.join(root, filename)}")
+                        logging.info("发现电视剧文件: %s", os.path.join(root, filename))
                         return True
         return False
     except Exception as e:
-        logging.warning(f"检查目录时出错: {directory}, 错误: {e}")
+        logging.warning("检查目录时出错: %s, 错误: %s", directory, e)
         return False
 
 
-def can_remove_directory(directory):
+def can_remove_files(directory, filenames):
     """
-    检查目录是否可以删除（为空或只包含被忽略的文件类型、孤立的字幕文件、无效的视频文件和可删除的子目录）
+    检查目录中的文件是否都可以删除（被忽略的文件类型、孤立的字幕文件、无效的视频文件），不检查子目录
     
     Args:
-        directory: 目录路径
+        directory: 目录路径（用于日志）
+        filenames: 目录中的文件名列表
         
     Returns:
-        bool: 是否可以删除目录
+        bool: 是否所有文件都可以删除
     """
-    # 检查目录是否存在
-    if not os.path.exists(directory) or not os.path.isdir(directory):
-        return False
+    # 检查是否包含电视剧文件，如果包含则跳过删除
+    for item in filenames:
+        ext = os.path.splitext(item)[1].lower()
+        if ext in VIDEO_EXTENSIONS:
+            # 检查是否是电视剧文件
+            if TV_SHOW_PATTERN.search(item):
+                logging.info("跳过删除包含电视剧文件的目录: %s (包含电视剧文件: %s)", directory, item)
+                return False
     
-    try:
-        # 获取目录中的所有内容
-        items = os.listdir(directory)
-        
-        # 如果目录为空，可以删除
-        if not items:
-            return True
-        
-        # 检查是否包含电视剧文件，如果包含则跳过删除
-        for item in items:
-            item_path = os.path.join(directory, item)
-            if os.path.isfile(item_path):
-                _, ext = os.path.splitext(item)
-                if ext.lower() in VIDEO_EXTENSIONS:
-                    # 检查是否是电视剧文件
-                    if TV_SHOW_PATTERN.search(item):
-                        logging.info(f"跳过删除包含电视剧文件的目录: {directory} (包含电视剧文件: {item})")
-                        return False
-        
-        # 首先收集所有有效视频文件的基础名称（不含扩展名）
-        valid_video_basenames = set()
-        for item in items:
-            item_path = os.path.join(directory, item)
-            if os.path.isfile(item_path):
-                _, ext = os.path.splitext(item)
-                if ext.lower() in VIDEO_EXTENSIONS:
-                    # 检查是否是有效的电影文件（能提取到年份）
-                    try:
-                        movie_name, year = extract_movie_info(item)
-                        if year is not None:  # 只有能提取到年份的才算有效视频文件
-                            basename = os.path.splitext(item)[0]
-                            valid_video_basenames.add(basename)
-                    except:
-                        # 如果提取信息失败，视为无效视频文件，可以删除
-                        pass
+    # 首先收集所有有效视频文件的基础名称（不含扩展名）
+    valid_video_basenames = set()
+    for item in filenames:
+        ext = os.path.splitext(item)[1].lower()
+        if ext in VIDEO_EXTENSIONS:
+            # 检查是否是有效的电影文件（能提取到年份）
+            try:
+                movie_name, year, _ = extract_movie_info(item)
+                if year is not None:  # 只有能提取到年份的才算有效视频文件
+                    basename = os.path.splitext(item)[0]
+                    valid_video_basenames.add(basename)
+            except:
+                # 如果提取信息失败，视为无效视频文件，可以删除
+                pass
+    
+    # 检查每个文件
+    for item in filenames:
+        # 检查文件扩展名
+        ext = os.path.splitext(item)[1].lower()
         
-        # 检查每个项目
-        for item in items:
-            item_path = os.path.join(directory, item)
+        if ext in IGNORED_EXTENSIONS:
+            # 被忽略的文件类型，可以删除
+            continue
+        elif ext in SUBTITLE_EXTENSIONS:
+            # 字幕文件，检查是否有对应的有效视频文件
+            subtitle_basename = os.path.splitext(item)[0]
             
-            if os.path.isfile(item_path):
-                # 检查文件扩展名
-                _, ext = os.path.splitext(item)
-                
-                if ext.lower() in IGNORED_EXTENSIONS:
-                    # 被忽略的文件类型，可以删除
-                    continue
-                elif ext.lower() in SUBTITLE_EXTENSIONS:
-                    # 字幕文件，检查是否有对应的有效视频文件
-                    subtitle_basename = os.path.splitext(item)[0]
-                    
-                    # 检查是否有完全匹配的有效视频文件
-                    has_matching_video = subtitle_basename in valid_video_basenames
-                    
-                    # 如果没有完全匹配，检查是否有部分匹配（考虑字幕文件可能有额外的语言标识）
-                    if not has_matching_video:
-                        for video_basename in valid_video_basenames:
-                            if subtitle_basename.startswith(video_basename):
-                                has_matching_video = True
-                                break
-                    
-                    # 如果没有对应的有效视频文件，视为孤立字幕文件，可以删除
-                    if not has_matching_video:
-                        continue
-                    else:
-                        # 有对应的有效视频文件，不能删除
-                        return False
-                elif ext.lower() in VIDEO_EXTENSIONS:
-                    # 视频文件，检查是否是有效的电影文件
-                    try:
-                        movie_name, year = extract_movie_info(item)
-                        if year is not None:
-                            # 有效的电影文件，不能删除
-                            return False
-                        else:
-                            # 无效的视频文件（如sample.mkv），可以删除
-                            continue
-                    except:
-                        # 如果提取信息失败，视为无效视频文件，可以删除
-                        continue
-                else:
-                    # 其他类型的文件，不能删除
-                    return False
-            elif os.path.isdir(item_path):
-                # 递归检查子目录
-                if not can_remove_directory(item_path):
+            # 检查是否有完全匹配的有效视频文件
+            has_matching_video = subtitle_basename in valid_video_basenames
+            
+            # 如果没有完全匹配，检查是否有部分匹配（考虑字幕文件可能有额外的语言标识）
+            if not has_matching_video:
+                for video_basename in valid_video_basenames:
+                    if subtitle_basename.startswith(video_basename):
+                        has_matching_video = True
+                        break
+            
+            # 如果没有对应的有效视频文件，视为孤立字幕文件，可以删除
+            if not has_matching_video:
+                continue
+            else:
+                # 有对应的有效视频文件，不能删除
+                return False
+        elif ext in VIDEO_EXTENSIONS:
+            # 视频文件，检查是否是有效的电影文件
+            try:
+                movie_name, year, _ = extract_movie_info(item)
+                if year is not None:
+                    # 有效的电影文件，不能删除
                     return False
+                else:
+                    # 无效的视频文件（如sample.mkv），可以删除
+                    continue
+            except:
+                # 如果提取信息失败，视为无效视频文件，可以删除
+                continue
+        else:
+            # 其他类型的文件，不能删除
+            return False
+    
+    return True
+
+
+def is_same_device(source_dir, target_dir, device_ids):
+    """
+    判断两个目录是否位于同一文件系统（设备号按目录缓存）
+    
+    Args:
+        source_dir: 源目录路径
+        target_dir: 目标目录路径
+        device_ids: 目录到设备号的缓存字典
         
-        return True
-        
-    except (OSError, PermissionError) as e:
-        logging.warning(f"检查目录时出错: {directory}, 错误: {e}")
-        return False
+    Returns:
+        bool: 是否位于同一设备，无法获取设备号时返回False
+    """
+    for path in (source_dir, target_dir):
+        if path not in device_ids:
+            try:
+                device_ids[path] = os.stat(path).st_dev
+            except OSError:
+                device_ids[path] = None
+    
+    source_device = device_ids[source_dir]
+    return source_device is not None and source_device == device_ids[target_dir]
 
 
-def move_file(source_file, target_dir, override_files=True, dry_run=False):
+def move_file(source_file, target_dir, override_files=True, dry_run=False, same_device=False,
+              normalized_filename=None):
     """
     移动文件到目标目录
     
@@ -720,13 +880,15 @@ def move_file(source_file, target_dir, override_files=True, dry_run=False):
         target_dir: 目标目录路径
         override_files: 是否覆盖已存在的文件
         dry_run: 是否为预览模式，只显示操作不实际执行
+        same_device: 源文件与目标目录是否位于同一文件系统，是则直接重命名
+        normalized_filename: 已规整的文件名（不含扩展名），未提供时根据源文件名计算
         
     Returns:
         bool: 是否成功移动文件
     """
     try:
         if not os.path.exists(source_file):
-            logging.warning(f"源文件不存在: {source_file}")
+            logging.warning("源文件不存在: %s", source_file)
             return False
             
         original_filename = os.path.basename(source_file)
@@ -735,8 +897,9 @@ def move_file(source_file, target_dir, override_files=True, dry_run=False):
         filename_without_ext, ext = os.path.splitext(original_filename)
         
         # 清理文件名：去除中文广告内容，然后标准化名称
-        cleaned_filename = remove_chinese_ads(filename_without_ext)
-        normalized_filename = normalize_name(cleaned_filename)
+        if normalized_filename is None:
+            cleaned_filename = remove_chinese_ads(filename_without_ext)
+            normalized_filename = normalize_name(cleaned_filename)
         
         # 重新组合文件名和扩展名
         clean_filename = normalized_filename + ext
@@ -746,20 +909,20 @@ def move_file(source_file, target_dir, override_files=True, dry_run=False):
         if dry_run:
             # 预览模式：只显示将要执行的操作
             if not os.path.exists(target_dir):
-                logging.info(f"[预览] 将创建目录: {target_dir}")
+                logging.info("[预览] 将创建目录: %s", target_dir)
             
             # 显示文件名清理信息
             if original_filename != clean_filename:
-                logging.info(f"[预览] 将清理文件名: {original_filename} -> {clean_filename}")
+                logging.info("[预览] 将清理文件名: %s -> %s", original_filename, clean_filename)
             
             if os.path.exists(target_file):
                 if not override_files:
-                    logging.warning(f"[预览] 目标文件已存在，将跳过: {target_file}")
+                    logging.warning("[预览] 目标文件已存在，将跳过: %s", target_file)
                     return False
                 else:
-                    logging.info(f"[预览] 将覆盖已存在的文件: {target_file}")
+                    logging.info("[预览] 将覆盖已存在的文件: %s", target_file)
             
-            logging.info(f"[预览] 将移动文件: {source_file} -> {target_file}")
+            logging.info("[预览] 将移动文件: %s -> %s", source_file, target_file)
             return True
         
         # 实际执行模式
@@ -768,79 +931,70 @@ def move_file(source_file, target_dir, override_files=True, dry_run=False):
         
         # 显示文件名清理信息
         if original_filename != clean_filename:
-            logging.info(f"清理文件名: {original_filename} -> {clean_filename}")
+            logging.info("清理文件名: %s -> %s", original_filename, clean_filename)
             
         if os.path.exists(target_file):
             if not override_files:
-                logging.warning(f"目标文件已存在，跳过: {target_file}")
+                logging.warning("目标文件已存在，跳过: %s", target_file)
                 return False
             else:
-                logging.info(f"覆盖已存在的文件: {target_file}")
+                logging.info("覆盖已存在的文件: %s", target_file)
+        
+        if same_device:
+            # 同一文件系统内直接原子重命名（覆盖已存在的文件），成功即说明目标文件已就位
+            try:
+                os.replace(source_file, target_file)
+                logging.info("移动文件: %s -> %s", source_file, target_file)
+                return True
+            except OSError as e:
+                # 目标目录实际位于其他文件系统（如挂载点）时退回到复制后删除；
+                # 目标路径是已存在的目录时，与shutil.move一致，将文件移动到该目录中
+                if e.errno != errno.EXDEV and not os.path.isdir(target_file):
+                    raise
         
         shutil.move(source_file, target_file)
         
         # 验证目标文件是否真正存在
         if os.path.exists(target_file):
-            logging.info(f"移动文件: {source_file} -> {target_file}")
+            logging.info("移动文件: %s -> %s", source_file, target_file)
             return True
         else:
-            logging.error(f"移动文件后验证失败，目标文件不存在: {target_file}")
+            logging.error("移动文件后验证失败，目标文件不存在: %s", target_file)
             return False
         
     except (OSError, PermissionError) as e:
-        logging.error(f"移动文件失败: {source_file} -> {target_dir}, 错误: {e}")
+        logging.error("移动文件失败: %s -> %s, 错误: %s", source_file, target_dir, e)
         return False
 
 
-def remove_empty_directories(directory, preserve_root=True, dry_run=False):
+def clean_directory(directory, file_entries, can_remove, remove_directory, dry_run=False):
     """
-    递归删除空目录和只包含垃圾文件的目录
+    清理单个目录中的垃圾文件，并在目录可以删除时删除目录本身（子目录应已处理完毕）
     
     Args:
-        directory: 要检查的目录路径
-        preserve_root: 是否保留根目录（默认为True，不删除传入的根目录）
+        directory: 目录路径
+        file_entries: 遍历时读取的文件目录项列表
+        can_remove: 目录是否可以删除（文件都可删除且子目录都已删除）
+        remove_directory: 目录可以删除时是否删除目录本身
         dry_run: 是否为预览模式，只显示操作不实际执行
         
     Returns:
-        bool: 是否成功删除了目录
+        bool: 是否删除了目录或清理了垃圾文件（预览模式下总是返回True）
     """
-    if not os.path.exists(directory) or not os.path.isdir(directory):
-        return False
-    
-    # 完全保护电视剧目录：如果目录包含电视剧文件，则完全跳过处理
-    if contains_tv_show_files(directory):
-        logging.info(f"检测到电视剧目录，完全跳过清理: {directory}")
-        return False
-    
-    removed_count = 0
-    
     try:
-        # 首先递归处理所有子目录
-        for item in os.listdir(directory):
-            item_path = os.path.join(directory, item)
-            if os.path.isdir(item_path):
-                # 递归处理子目录，子目录可以被删除
-                if remove_empty_directories(item_path, preserve_root=False, dry_run=dry_run):
-                    removed_count += 1
-        
-        # 检查当前目录是否可以删除
-        can_remove = can_remove_directory(directory)
-        
         if dry_run:
             # 预览模式：只显示将要执行的操作
             junk_files = []
-            for item in os.listdir(directory):
-                item_path = os.path.join(directory, item)
-                if os.path.isfile(item_path):
-                    _, ext = os.path.splitext(item)
-                    if ext.lower() in IGNORED_EXTENSIONS:
-                        junk_files.append(item_path)
+            for entry in file_entries:
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext in IGNORED_EXTENSIONS:
+                    junk_files.append(entry.path)
             
             if junk_files:
-                logging.info(f"[预览] 将删除垃圾文件: {', '.join(junk_files)}")
+                logging.info("[预览] 将删除垃圾文件: %s", ', '.join(junk_files))
             
-            if can_remove and not preserve_root:
-                logging.info(f"[预览] 将删除空目录: {directory}")
+            if can_remove and remove_directory:
+                logging.info("[预览] 将删除空目录: %s", directory)
             return True
         else:
             # 实际执行模式
@@ -849,85 +1003,216 @@ def remove_empty_directories(directory, preserve_root=True, dry_run=False):
             
             # 首先收集所有有效视频文件的基础名称（能提取到年份的）
             valid_video_basenames = set()
-            for item in os.listdir(directory):
-                item_path = os.path.join(directory, item)
-                if os.path.isfile(item_path):
-                    _, ext = os.path.splitext(item)
-                    if ext.lower() in VIDEO_EXTENSIONS:
-                        try:
-                            movie_name, year = extract_movie_info(item)
-                            if year is not None:  # 只有能提取到年份的才算有效视频文件
-                                basename = os.path.splitext(item)[0]
-                                valid_video_basenames.add(basename)
-                        except:
-                            # 如果提取信息失败，视为无效视频文件
-                            pass
+            for entry in file_entries:
+                item = entry.name
+                ext = os.path.splitext(item)[1].lower()
+                if ext in VIDEO_EXTENSIONS:
+                    try:
+                        movie_name, year, _ = extract_movie_info(item)
+                        if year is not None:  # 只有能提取到年份的才算有效视频文件
+                            basename = os.path.splitext(item)[0]
+                            valid_video_basenames.add(basename)
+                    except:
+                        # 如果提取信息失败，视为无效视频文件
+                        pass
             
             # 删除垃圾文件、孤立的字幕文件和无效的视频文件
-            for item in os.listdir(directory):
-                item_path = os.path.join(directory, item)
-                if os.path.isfile(item_path):
-                    _, ext = os.path.splitext(item)
-                    should_remove = False
-                    remove_reason = ""
-                    
-                    # 检查是否是垃圾文件
-                    if ext.lower() in IGNORED_EXTENSIONS:
+            for entry in file_entries:
+                item = entry.name
+                item_path = entry.path
+                ext = os.path.splitext(item)[1].lower()
+                should_remove = False
+                remove_reason = ""
+                
+                # 检查是否是垃圾文件
+                if ext in IGNORED_EXTENSIONS:
+                    should_remove = True
+                    remove_reason = "垃圾文件"
+                # 检查是否是孤立的字幕文件
+                elif ext in SUBTITLE_EXTENSIONS:
+                    basename = os.path.splitext(item)[0]
+                    if basename not in valid_video_basenames:
                         should_remove = True
-                        remove_reason = "垃圾文件"
-                    # 检查是否是孤立的字幕文件
-                    elif ext.lower() in SUBTITLE_EXTENSIONS:
-                        basename = os.path.splitext(item)[0]
-                        if basename not in valid_video_basenames:
-                            should_remove = True
-                            remove_reason = "孤立字幕文件"
-                    # 检查是否是无效的视频文件
-                    elif ext.lower() in VIDEO_EXTENSIONS:
-                        # 首先检查是否是电视剧文件，如果是则跳过删除
-                        if TV_SHOW_PATTERN.search(item):
-                            should_remove = False
-                            logging.info(f"跳过删除电视剧文件: {item_path}")
-                        else:
-                            try:
-                                movie_name, year = extract_movie_info(item)
-                                if year is None:
-                                    should_remove = True
-                                    remove_reason = "无效视频文件"
-                            except:
+                        remove_reason = "孤立字幕文件"
+                # 检查是否是无效的视频文件
+                elif ext in VIDEO_EXTENSIONS:
+                    # 首先检查是否是电视剧文件，如果是则跳过删除
+                    if TV_SHOW_PATTERN.search(item):
+                        should_remove = False
+                        logging.info("跳过删除电视剧文件: %s", item_path)
+                    else:
+                        try:
+                            movie_name, year, _ = extract_movie_info(item)
+                            if year is None:
                                 should_remove = True
                                 remove_reason = "无效视频文件"
-                    
-                    if should_remove:
-                        try:
-                            os.remove(item_path)
-                            logging.info(f"删除{remove_reason}: {item_path}")
-                            junk_files_removed += 1
-                        except Exception as e:
-                            logging.warning(f"删除文件失败: {item_path}, 错误: {e}")
+                        except:
+                            should_remove = True
+                            remove_reason = "无效视频文件"
+                
+                if should_remove:
+                    try:
+                        os.remove(item_path)
+                        logging.info("删除%s: %s", remove_reason, item_path)
+                        junk_files_removed += 1
+                    except Exception as e:
+                        logging.warning("删除文件失败: %s, 错误: %s", item_path, e)
             
             # 如果可以删除且不保留根目录，尝试删除目录本身
-            if can_remove and not preserve_root:
+            if can_remove and remove_directory:
                 try:
                     os.rmdir(directory)
-                    logging.info(f"删除空目录: {directory}")
+                    logging.info("删除空目录: %s", directory)
                     return True
                 except Exception as e:
-                    logging.warning(f"删除目录失败: {directory}, 错误: {e}")
+                    logging.warning("删除目录失败: %s, 错误: %s", directory, e)
                     return False
             else:
                 # 保留根目录或目录不能删除，但返回是否清理了垃圾文件
                 return junk_files_removed > 0
         
-        return removed_count > 0
-        
     except (OSError, PermissionError) as e:
-        logging.warning(f"处理目录时出错: {directory}, 错误: {e}")
+        logging.warning("处理目录时出错: %s, 错误: %s", directory, e)
         return False
 
 
+def move_file_group(moves, override_files=True, dry_run=False):
+    """
+    按顺序移动一组文件（同一目标目录的文件放在同一组中，避免并发写入同名文件）
+    
+    Args:
+        moves: [(源文件路径, 目标目录, 是否同一文件系统, 规整后的文件名), ...]
+        override_files: 是否覆盖已存在的文件
+        dry_run: 是否为预览模式，只显示操作不实际执行
+        
+    Returns:
+        list: 每个文件是否移动成功
+    """
+    return [move_file(source_file, target_dir, override_files, dry_run, same_device, normalized_filename)
+            for source_file, target_dir, same_device, normalized_filename in moves]
+
+
+def move_files(moves, override_files=True, dry_run=False, jobs=1):
+    """
+    批量移动文件，jobs大于1时使用线程池并行移动
+    
+    Args:
+        moves: [(源文件路径, 目标目录, 是否同一文件系统, 规整后的文件名), ...]
+        override_files: 是否覆盖已存在的文件
+        dry_run: 是否为预览模式，预览模式总是按顺序执行以保持日志顺序
+        jobs: 并行移动的线程数
+        
+    Returns:
+        list: 与moves一一对应的移动结果
+    """
+    if dry_run or jobs <= 1 or len(moves) <= 1:
+        return move_file_group(moves, override_files, dry_run)
+    
+    # 按目标目录分组，不同目录之间并行移动，同一目录内按顺序移动
+    groups = {}
+    for index, move in enumerate(moves):
+        groups.setdefault(move[1], []).append(index)
+    
+    group_indexes = list(groups.values())
+    group_moves = [[moves[index] for index in indexes] for indexes in group_indexes]
+    
+    results = [False] * len(moves)
+    with ThreadPoolExecutor(max_workers=min(jobs, len(group_moves))) as executor:
+        group_results = executor.map(move_file_group, group_moves, [override_files] * len(group_moves))
+        for indexes, moved in zip(group_indexes, group_results):
+            for index, result in zip(indexes, moved):
+                results[index] = result
+    
+    return results
+
+
+def remove_empty_directories(directory, preserve_root=True, dry_run=False):
+    """
+    递归删除空目录和只包含垃圾文件的目录
+    
+    Args:
+        directory: 要检查的目录路径
+        preserve_root: 是否保留根目录（默认为True，不删除传入的根目录）
+        dry_run: 是否为预览模式，只显示操作不实际执行
+        
+    Returns:
+        bool: 是否成功删除了目录
+    """
+    if not os.path.isdir(directory):
+        return False
+    
+    # 完全保护电视剧目录：如果目录包含电视剧文件，则完全跳过处理
+    # 根目录不包含电视剧文件时，其下的子目录也不会包含，无需逐层重复检查
+    if contains_tv_show_files(directory):
+        logging.info("检测到电视剧目录，完全跳过清理: %s", directory)
+        return False
+    
+    # 使用显式栈代替递归，按后序（先子目录、后父目录）排列所有目录，
+    # 每个目录只读取一次内容
+    postorder_dirs = []  # [(目录路径, 目录项列表, 读取错误)]
+    pending = [(directory, None)]
+    while pending:
+        current_dir, entries = pending.pop()
+        if entries is not None:
+            # 子目录都已排在前面，轮到目录本身
+            postorder_dirs.append((current_dir, entries, None))
+            continue
+        
+        try:
+            with os.scandir(current_dir) as it:
+                entries = list(it)
+            # 与根目录的电视剧检查（os.walk）一致，不进入符号链接指向的目录，
+            # 否则链接指向的电视剧目录会绕过检查而被清理；
+            # 与移动时的遍历一致，也不进入隐藏目录，其中的文件没有被处理过
+            subdirs = [entry.path for entry in entries
+                       if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.')]
+        except (OSError, PermissionError) as e:
+            postorder_dirs.append((current_dir, None, e))
+            continue
+        
+        # 子目录按目录中的顺序先于当前目录处理
+        pending.append((current_dir, entries))
+        pending.extend((subdir, None) for subdir in reversed(subdirs))
+    
+    # 在同一次遍历中判断并删除：子目录先处理，父目录只需检查自身文件和子目录的结果，
+    # 不必再次遍历整个子树
+    removable_dirs = set()  # 已删除（预览模式下为可以删除）的目录
+    result = False
+    for current_dir, entries, error in postorder_dirs:
+        if error is not None:
+            logging.warning("处理目录时出错: %s, 错误: %s", current_dir, error)
+            result = False
+            continue
+        
+        try:
+            # 处理子目录不会改变当前目录中的文件，共用遍历时读取的目录项
+            file_entries = [entry for entry in entries if entry.is_file()]
+            subdirs = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+            
+            # 子目录都已删除且文件都可以删除时，当前目录可以删除；
+            # 跳过的隐藏目录不会出现在 removable_dirs 中，包含它们的目录会被保留
+            can_remove = (all(subdir in removable_dirs for subdir in subdirs) and
+                          can_remove_files(current_dir, [entry.name for entry in file_entries]))
+        except (OSError, PermissionError) as e:
+            logging.warning("检查目录时出错: %s, 错误: %s", current_dir, e)
+            can_remove = False
+            file_entries = []
+        
+        # 子目录可以被删除，根目录根据 preserve_root 决定
+        remove_directory = current_dir != directory or not preserve_root
+        result = clean_directory(current_dir, file_entries, can_remove, remove_directory, dry_run)
+        
+        # 实际执行模式下，可以删除且返回成功即表示目录已被删除
+        if can_remove and (dry_run or result):
+            removable_dirs.add(current_dir)
+    
+    # 根目录最后处理，返回其处理结果
+    return result
+
+
 def process_directory(source_dir, target_base_dir, resolution=None, codec=None, 
                      year_group=False, remove_source=False, require_ai_subtitle=True, 
-                     override_files=True, dry_run=False):
+                     override_files=True, dry_run=False, jobs=1):
     """
     处理源目录中的所有电影文件
     
@@ -941,6 +1226,7 @@ def process_directory(source_dir, target_base_dir, resolution=None, codec=None,
         require_ai_subtitle: 是否只处理存在.ai.srt字幕文件的视频
         override_files: 是否覆盖已存在的文件，默认为True
         dry_run: 是否为预览模式，只显示操作不实际执行
+        jobs: 并行移动视频文件的线程数，默认为1（按顺序移动）
         
     Returns:
         tuple: (成功数, 失败数, 跳过数, 删除目录数)
@@ -954,143 +1240,190 @@ def process_directory(source_dir, target_base_dir, resolution=None, codec=None,
     processed_dirs = set()
     # 收集跳过的电视剧目录，避免重复检查
     skipped_tv_dirs = set()
-    # 记录成功移动的视频文件，用于后续移动对应的字幕文件
-    moved_videos = {}  # {video_basename_without_ext: (target_dir, source_dir)}
-    
-    # 第一阶段：处理视频文件
-    for root, _, files in os.walk(source_dir, topdown=False):
+    # 按所在目录记录成功移动的视频文件，用于后续移动对应的字幕文件
+    moved_by_dir = {}  # {source_dir: [(video_basename_without_ext, target_dir, normalized_basename), ...]}
+    
+    # 缓存目录所在的设备号，同一文件系统内的移动可以直接重命名
+    device_ids = {}
+    # 已确认存在的目标目录，同一电影目录只需创建一次
+    known_dirs = set()
+    # 没有指定分辨率和编码时所有文件都匹配，循环中不必逐个调用匹配函数
+    needs_filter = bool(resolution or codec)
+    
+    # 一次遍历收集所有目录的文件项，两个阶段共用，避免重复遍历目录树；
+    # 同时记录每个子目录的父目录，删除源目录时直接查找
+    parent_dirs = {}
+    dir_entries = dict(iter_directory_entries(source_dir, parent_dirs))
+    
+    # 第一阶段：处理视频文件，先确定每个文件的目标目录，再统一移动
+    pending_moves = []  # [(所在目录, 文件名, 不含扩展名的文件名, 源文件路径, 规整后的文件名, 目标目录)]
+    for root, entries in dir_entries.items():
         # 检查当前目录是否已经被标记为电视剧目录
         if root in skipped_tv_dirs:
             continue
-            
+        
+        files = [entry.name for entry in entries]
+        
         # 检查当前目录（不递归）是否包含电视剧文件
-        if contains_tv_show_files_in_directory_only(root):
-            logging.info(f"检测到电视剧目录，跳过处理: {root}")
+        if contains_tv_show_files_in_directory_only(root, files):
+            logging.info("检测到电视剧目录，跳过处理: %s", root)
             skipped_tv_dirs.add(root)
             continue
-            
-        for filename in files:
+        
+        # 当前目录的文件名集合，用于在内存中检查对应的.ai.srt字幕文件
+        dir_filenames = set(files)
+        
+        for entry in entries:
+            filename = entry.name
             # 检查是否为电影文件
             if not is_movie(filename):
                 continue
             
             # 检查是否匹配目标分辨率和编码
-            if not match_resolution_and_codec(filename, resolution, codec):
-                logging.info(f"跳过不匹配的文件: {filename}")
+            if needs_filter and not match_resolution_and_codec(filename, resolution, codec):
+                logging.info("跳过不匹配的文件: %s", filename)
                 skipped_count += 1
                 continue
             
-            source_path = os.path.join(root, filename)
+            source_path = entry.path
+            # 视频文件名（不含扩展名）只计算一次，AI字幕检查和后续字幕匹配共用
+            video_basename = os.path.splitext(filename)[0]
             
-            # 如果启用了AI字幕检查，检查是否存在对应的.ai.srt字幕文件
+            # 如果启用了AI字幕检查，在目录的文件名集合中检查是否存在对应的.ai.srt字幕文件
             if require_ai_subtitle:
-                if not has_ai_subtitle(source_path):
-                    logging.info(f"跳过文件: {filename} (未找到对应的.ai.srt字幕文件)")
+                if f"{video_basename}.ai.srt" not in dir_filenames:
+                    logging.info("跳过文件: %s (未找到对应的.ai.srt字幕文件)", filename)
                     skipped_count += 1
                     continue
             
             # 提取电影名称和年份
-            movie_name, year = extract_movie_info(filename)
+            movie_name, year, normalized_basename = extract_movie_info(filename)
             if not movie_name:
-                logging.warning(f"跳过文件: {filename} (无法提取电影名称)")
+                logging.warning("跳过文件: %s (无法提取电影名称)", filename)
                 skipped_count += 1
                 continue
             
             # 检查年份是否提取成功
             if not year:
-                logging.warning(f"跳过文件: {filename} (无法提取电影年份)")
+                logging.warning("跳过文件: %s (无法提取电影年份)", filename)
                 skipped_count += 1
                 continue
             
-            # 获取不含扩展名的完整文件名
-            filename_without_ext = os.path.splitext(filename)[0]
-            
             # 检查是否包含受限制关键词，如果是则临时更换目标基础目录
             current_target_base_dir = target_base_dir
             is_restricted = contains_restricted_keywords(filename)
             if is_restricted:
                 current_target_base_dir = RESTRICTED_TARGET_DIR
-                logging.info(f"检测到受限制关键词，临时更换目标目录为: {current_target_base_dir}")
+                logging.info("检测到受限制关键词，临时更换目标目录为: %s", current_target_base_dir)
             
-            # 使用统一的逻辑创建目标目录
-            target_dir = create_target_directory(current_target_base_dir, filename_without_ext, year, year_group)
+            # 使用统一的逻辑创建目标目录，目录名与文件名共用提取信息时规整好的名称
+            target_dir = create_target_directory(current_target_base_dir, normalized_basename, year, year_group,
+                                                 known_dirs)
             if target_dir is None:
-                logging.error(f"跳过文件: {filename} (无法创建目标目录)")
+                logging.error("跳过文件: %s (无法创建目标目录)", filename)
                 failure_count += 1
                 continue
             
             if is_restricted:
-                logging.info(f"受限制内容目标目录: {target_dir} (电影: {movie_name}, 年份: {year or '未知'})")
+                logging.info("受限制内容目标目录: %s (电影: %s, 年份: %s)", target_dir, movie_name, year or '未知')
             else:
-                logging.info(f"目标目录: {target_dir} (电影: {movie_name}, 年份: {year or '未知'})")
+                logging.info("目标目录: %s (电影: %s, 年份: %s)", target_dir, movie_name, year or '未知')
             
-            # 移动视频文件
-            if move_file(source_path, target_dir, override_files, dry_run):
-                success_count += 1
-                # 记录处理过的目录
-                processed_dirs.add(os.path.dirname(source_path))
-                # 记录成功移动的视频文件，用于后续移动字幕文件
-                video_basename = os.path.splitext(filename)[0]
-                moved_videos[video_basename] = (target_dir, root)
-                logging.info(f"成功移动视频文件: {filename}")
-            else:
-                failure_count += 1
+            pending_moves.append((root, filename, video_basename, source_path, normalized_basename, target_dir))
+    
+    # 移动视频文件
+    moves = [
+        (source_path, target_dir, not dry_run and is_same_device(root, target_dir, device_ids), normalized_basename)
+        for root, _, _, source_path, normalized_basename, target_dir in pending_moves
+    ]
+    move_results = move_files(moves, override_files, dry_run, jobs)
+    
+    for (root, filename, video_basename, _, normalized_basename, target_dir), moved in zip(pending_moves, move_results):
+        if moved:
+            success_count += 1
+            # 记录处理过的目录
+            processed_dirs.add(root)
+            # 记录成功移动的视频文件，用于后续移动字幕文件
+            moved_by_dir.setdefault(root, []).append((video_basename, target_dir, normalized_basename))
+            logging.info("成功移动视频文件: %s", filename)
+        else:
+            failure_count += 1
     
     # 第二阶段：处理字幕文件，只移动对应视频文件已成功移动的字幕文件
-    for root, _, files in os.walk(source_dir, topdown=False):
-        for filename in files:
+    for root, entries in dir_entries.items():
+        # 只需在同一目录已移动的视频中查找，按名称长度从长到短排列，
+        # 使字幕优先匹配最具体的视频（如 Film.Extended 优先于 Film）
+        dir_videos = moved_by_dir.get(root, [])
+        dir_videos.sort(key=lambda video: len(video[0]), reverse=True)
+        # 字幕名通常与视频名完全相同（如 Film.srt），先按名称直接查找；
+        # 完全相同的名称就是最长的前缀，与按长度查找的结果一致
+        exact_videos = {}
+        for video in dir_videos:
+            exact_videos.setdefault(video[0], video)
+        
+        for entry in entries:
+            filename = entry.name
             # 检查文件扩展名是否为字幕文件
-            _, ext = os.path.splitext(filename)
+            subtitle_basename, ext = os.path.splitext(filename)
             if ext.lower() not in SUBTITLE_EXTENSIONS:
                 continue
             
             # 检查是否匹配目标分辨率和编码
-            if not match_resolution_and_codec(filename, resolution, codec):
-                logging.info(f"跳过不匹配的字幕文件: {filename}")
+            if needs_filter and not match_resolution_and_codec(filename, resolution, codec):
+                logging.info("跳过不匹配的字幕文件: %s", filename)
                 skipped_count += 1
                 continue
             
-            source_path = os.path.join(root, filename)
-            subtitle_basename = os.path.splitext(filename)[0]
+            source_path = entry.path
             
             # 查找对应的视频文件是否已被移动
             corresponding_video = None
-            for video_basename, (target_dir, video_root) in moved_videos.items():
-                if video_root == root and subtitle_basename.startswith(video_basename):
-                    corresponding_video = (target_dir, video_basename)
-                    break
+            exact_video = exact_videos.get(subtitle_basename)
+            if exact_video is not None:
+                video_basename, target_dir, normalized_video = exact_video
+                corresponding_video = (target_dir, video_basename, normalized_video)
+            else:
+                for video_basename, target_dir, normalized_video in dir_videos:
+                    if subtitle_basename.startswith(video_basename):
+                        corresponding_video = (target_dir, video_basename, normalized_video)
+                        break
             
             if corresponding_video is None:
                 # 没有对应的视频文件，跳过字幕文件
-                logging.info(f"跳过字幕文件: {filename} (对应的视频文件未被移动)")
+                logging.info("跳过字幕文件: %s (对应的视频文件未被移动)", filename)
                 skipped_count += 1
                 continue
             else:
-                target_dir, video_basename = corresponding_video
+                target_dir, video_basename, normalized_video = corresponding_video
+            
+            # 字幕文件名沿用对应视频规整后的名称，保证字幕与视频文件名一致
+            normalized_subtitle = build_subtitle_name(normalized_video, video_basename, subtitle_basename)
             
             # 移动字幕文件
-            if move_file(source_path, target_dir, override_files, dry_run):
+            same_device = not dry_run and is_same_device(root, target_dir, device_ids)
+            if move_file(source_path, target_dir, override_files, dry_run, same_device,
+                         normalized_subtitle):
                 success_count += 1
                 # 记录处理过的目录
-                processed_dirs.add(os.path.dirname(source_path))
-                logging.info(f"成功移动字幕文件: {filename} (对应视频: {video_basename})")
+                processed_dirs.add(root)
+                logging.info("成功移动字幕文件: %s (对应视频: %s)", filename, video_basename)
             else:
                 failure_count += 1
     
     # 如果需要删除源目录
     if remove_source:
-        # 收集所有需要检查的目录，包括处理过的目录及其父目录
-        dirs_to_check = set(processed_dirs)
+        # 收集所有需要检查的目录及其深度，包括处理过的目录及其父目录
+        dir_depths = {dir_path: dir_path.count(os.sep) for dir_path in processed_dirs}
         
         # 对于每个处理过的目录，也检查其父目录（电影通常在单独的子目录中）
-        for dir_path in list(processed_dirs):
-            parent_dir = os.path.dirname(dir_path)
+        for dir_path in processed_dirs:
+            parent_dir = parent_dirs.get(dir_path)
             # 确保不删除源目录本身，只删除其子目录
-            if parent_dir != source_dir and parent_dir.startswith(source_dir):
-                dirs_to_check.add(parent_dir)
+            if parent_dir is not None and parent_dir != source_dir:
+                dir_depths.setdefault(parent_dir, parent_dir.count(os.sep))
         
         # 按照目录深度从深到浅排序，确保先删除子目录
-        sorted_dirs = sorted(dirs_to_check, key=lambda x: x.count(os.sep), reverse=True)
+        sorted_dirs = sorted(dir_depths, key=dir_depths.__getitem__, reverse=True)
         
         for dir_path in sorted_dirs:
             # 跳过源目录本身
@@ -1101,18 +1434,18 @@ def process_directory(source_dir, target_base_dir, resolution=None, codec=None,
             if remove_empty_directories(dir_path, preserve_root=False, dry_run=dry_run):
                 removed_dirs_count += 1
                 if dry_run:
-                    logging.info(f"[预览] 将删除目录及其子目录: {dir_path}")
+                    logging.info("[预览] 将删除目录及其子目录: %s", dir_path)
                 else:
-                    logging.info(f"成功删除目录及其子目录: {dir_path}")
+                    logging.info("成功删除目录及其子目录: %s", dir_path)
             else:
-                logging.debug(f"目录不为空或删除失败，跳过: {dir_path}")
+                logging.debug("目录不为空或删除失败，跳过: %s", dir_path)
         
         # 最后尝试清理源目录下的空目录和垃圾文件（但保留源目录本身）
         if remove_empty_directories(source_dir, preserve_root=True, dry_run=dry_run):
             if dry_run:
-                logging.info(f"[预览] 将清理源目录下的空目录和垃圾文件: {source_dir}")
+                logging.info("[预览] 将清理源目录下的空目录和垃圾文件: %s", source_dir)
             else:
-                logging.info(f"清理了源目录下的空目录和垃圾文件: {source_dir}")
+                logging.info("清理了源目录下的空目录和垃圾文件: %s", source_dir)
     
     return success_count, failure_count, skipped_count, removed_dirs_count
 
@@ -1130,6 +1463,8 @@ def main():
     parser.add_argument('--no-override', action='store_true', help='不覆盖已存在的目标文件（默认覆盖已存在的文件）')
     parser.add_argument('--dry-run', action='store_true', help='预览模式：只显示将要执行的操作，不实际移动或删除文件')
     parser.add_argument('--confirm-delete', action='store_true', help='删除目录前需要用户确认（与--remove-source一起使用）')
+    parser.add_argument('--jobs', type=int, default=MAX_MOVE_JOBS,
+                        help=f'并行移动视频文件的线程数，1表示按顺序移动（默认: {MAX_MOVE_JOBS}）')
     parser.add_argument('--version', action='version', version=f'mv2moviedir {__version__}')
     
     args = parser.parse_args()
@@ -1144,15 +1479,17 @@ def main():
     override_files = not args.no_override  # 默认覆盖文件，--no-override时不覆盖
     dry_run = args.dry_run
     confirm_delete = args.confirm_delete
+    jobs = args.jobs
+    
+    if jobs < 1:
+        parser.error(f"--jobs 必须大于等于1: {jobs}")
     
     # 检查源目录和目标目录是否存在
     if not os.path.isdir(source_dir):
-        print(f"错误: 源目录不存在: {source_dir}")
-        sys.exit(1)
+        parser.error(f"源目录不存在: {source_dir}")
     
     if not os.path.isdir(target_dir):
-        print(f"错误: 目标目录不存在: {target_dir}")
-        sys.exit(1)
+        parser.error(f"目标目录不存在: {target_dir}")
     
     # 检查目标目录权限
     if not dry_run and not check_directory_permissions(target_dir):
@@ -1162,25 +1499,26 @@ def main():
     
     # 安全检查：防止意外删除重要目录
     if remove_source:
-        # 检查源目录是否为系统重要目录
-        important_dirs = ['/home', '/Users', '/root', '/etc', '/var', '/usr', '/bin', '/sbin', '/opt']
+        # 源目录和目标目录的绝对路径只计算一次，后续检查共用
         source_abs = os.path.abspath(source_dir)
+        target_abs = os.path.abspath(target_dir)
+        # 源目录加上末尾分隔符作为前缀，按完整路径组件判断包含关系（/a/b 不是 /a/bc 的前缀）
+        source_prefix = source_abs.rstrip(os.sep) + os.sep
         
+        # 检查源目录是否为系统重要目录
+        important_dirs = ['/home', '/Users', '/root', '/etc', '/var', '/usr', '/bin', '/sbin', '/opt']
         for important_dir in important_dirs:
-            if source_abs.startswith(important_dir) and source_abs.count(os.sep) <= important_dir.count(os.sep) + 2:
-                print(f"错误: 为了安全起见，不允许删除系统重要目录附近的目录: {source_dir}")
-                print("请使用更深层的子目录作为源目录")
-                sys.exit(1)
+            in_important_dir = source_abs == important_dir or source_abs.startswith(important_dir + os.sep)
+            if in_important_dir and source_abs.count(os.sep) <= important_dir.count(os.sep) + 2:
+                parser.error(f"为了安全起见，不允许删除系统重要目录附近的目录: {source_dir}，"
+                             "请使用更深层的子目录作为源目录")
         
         # 检查源目录和目标目录是否相同或有包含关系
-        target_abs = os.path.abspath(target_dir)
         if source_abs == target_abs:
-            print(f"错误: 源目录和目标目录不能相同: {source_dir}")
-            sys.exit(1)
+            parser.error(f"源目录和目标目录不能相同: {source_dir}")
         
-        if target_abs.startswith(source_abs):
-            print(f"错误: 目标目录不能在源目录内部: 源={source_dir}, 目标={target_dir}")
-            sys.exit(1)
+        if target_abs.startswith(source_prefix):
+            parser.error(f"目标目录不能在源目录内部: 源={source_dir}, 目标={target_dir}")
         
         # 如果启用了确认删除，给出警告
         if confirm_delete and not dry_run:
@@ -1207,12 +1545,12 @@ def main():
     if not override_files:
         filter_info += f", 覆盖文件 = 否"
     
-    logging.info(f"mv2moviedir v{__version__} - 开始处理: 源目录 = {source_dir}, 目标目录 = {target_dir}{filter_info}")
+    logging.info("mv2moviedir v%s - 开始处理: 源目录 = %s, 目标目录 = %s%s", __version__, source_dir, target_dir, filter_info)
     
     # 处理目录
     success_count, failure_count, skipped_count, removed_dirs_count = process_directory(
         source_dir, target_dir, resolution, codec, year_group, remove_source, 
-        require_ai_subtitle, override_files, dry_run
+        require_ai_subtitle, override_files, dry_run, jobs
     )
     
     # 输出处理结果
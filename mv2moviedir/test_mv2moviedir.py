@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+mv2moviedir 的单元测试
+
+运行：python3 -m unittest test_mv2moviedir（在本目录下），或 python3 -m pytest
+"""
+
+import os
+import sys
+import shutil
+import logging
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mv2moviedir import build_subtitle_name, process_directory
+
+
+class BuildSubtitleNameTest(unittest.TestCase):
+    """字幕文件名沿用视频规整后的名称"""
+
+    def test_same_name_as_video(self):
+        self.assertEqual(build_subtitle_name('Film.2020', 'Film (2020)', 'Film (2020)'), 'Film.2020')
+
+    def test_suffix_with_separator(self):
+        self.assertEqual(build_subtitle_name('Film.2020', 'Film (2020)', 'Film (2020).ai'), 'Film.2020.ai')
+        self.assertEqual(build_subtitle_name('Film.2020', 'Film (2020)', 'Film (2020) chs'), 'Film.2020.chs')
+
+    def test_suffix_without_separator(self):
+        # 后缀不以分隔符开头时不插入点号
+        self.assertEqual(build_subtitle_name('Film', 'Film', 'Film2'), 'Film2')
+        self.assertEqual(build_subtitle_name('Film', 'Film', 'Film-eng'), 'Film-eng')
+
+    def test_unsafe_characters_in_suffix(self):
+        self.assertEqual(build_subtitle_name('Film', 'Film', 'Film.a:b'), 'Film.a.b')
+
+
+
+class RemoveSourceTest(unittest.TestCase):
+    """--remove-source 的清理不能删除移动时跳过的隐藏目录中的文件"""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.tmp = tempfile.mkdtemp(prefix='mv2moviedir_test_')
+        self.source = os.path.join(self.tmp, 'src')
+        self.target = os.path.join(self.tmp, 'tgt')
+        os.makedirs(self.target)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        shutil.rmtree(self.tmp)
+
+    def test_keeps_files_in_hidden_directory(self):
+        hidden = os.path.join(self.source, 'A', '.hid')
+        os.makedirs(hidden)
+        for name in ('Bar.2019.1080p.mkv', 'Bar.2019.1080p.ai.srt'):
+            with open(os.path.join(hidden, name), 'w') as f:
+                f.write(name)
+
+        process_directory(self.source, self.target, remove_source=True)
+
+        self.assertEqual(sorted(os.listdir(hidden)), ['Bar.2019.1080p.ai.srt', 'Bar.2019.1080p.mkv'])
+
+
+if __name__ == '__main__':
+    unittest.main()
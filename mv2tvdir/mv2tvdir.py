@@ -30,9 +30,15 @@ mv2tvdir - 将电视剧文件移动到按剧名/季级组织的目录结构中
 import os
 import sys
 import re
+import errno
 import shutil
 import logging
 import argparse
+from functools import lru_cache
+
+# 名称规整结果缓存的最大条目数
+# 同一部剧的每一集都会用相同的剧名规整目标目录名
+NAME_CACHE_SIZE = 8192
 
 # 配置日志
 logging.basicConfig(
@@ -40,19 +46,29 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-# 支持的视频和字幕文件扩展名
-VIDEO_EXTENSIONS = ('.mkv', '.mp4', '.avi')
-SUBTITLE_EXTENSIONS = ('.srt', '.ass', '.sub')
-SUPPORTED_EXTENSIONS = VIDEO_EXTENSIONS + SUBTITLE_EXTENSIONS
+# 支持的视频和字幕文件扩展名（均为小写，与小写后的扩展名比较）
+VIDEO_EXTENSIONS = frozenset(('.mkv', '.mp4', '.avi'))
+SUBTITLE_EXTENSIONS = frozenset(('.srt', '.ass', '.sub'))
+SUPPORTED_EXTENSIONS = VIDEO_EXTENSIONS | SUBTITLE_EXTENSIONS
 
 # 不需要删除的文件类型（在源目录中保留的文件类型）
-IGNORED_EXTENSIONS = ('.nfo', '.txt', '.jpg', '.jpeg', '.png', '.gif')
+IGNORED_EXTENSIONS = frozenset(('.nfo', '.txt', '.jpg', '.jpeg', '.png', '.gif'))
 
 # 正则表达式模式，用于从文件名中提取剧名和季数
 # 例如："Invasion.2021.S03E04.1080p.x265-ELiTE"
 SEASON_PATTERN = re.compile(r'[.\s\(\)\[\]][Ss]([0-9]{1,2})[Ee][0-9]{1,2}[.\s\(\)\[\]]')
 YEAR_PATTERN = re.compile(r'[.\s\(\)\[\]](19[0-9]{2}|20[0-9]{2})[.\s\(\)\[\]]')
 
+# 季数和年份的组合模式：一次扫描同时找出两者的首次出现位置。
+# 两个分支都放在零宽前瞻中，匹配不会消耗字符，相邻的年份和季数仍能各自被找到
+SHOW_INFO_GROUPS = ('season', 'year')
+SHOW_INFO_PATTERN = re.compile(
+    '(?=' + '|'.join(
+        '(?P<%s>%s)' % (name, pattern.pattern)
+        for name, pattern in zip(SHOW_INFO_GROUPS, (SEASON_PATTERN, YEAR_PATTERN))
+    ) + ')'
+)
+
 # 用于识别电视剧的模式（包含SxxExx格式）
 TV_SHOW_PATTERN = re.compile(r'[.\s\(\)\[\]][Ss][0-9]{1,2}[Ee][0-9]{1,2}[.\s\(\)\[\]]')
 
@@ -63,6 +79,15 @@ CODEC_PATTERN = re.compile(r'[.\s\(\)\[\]](x26[45])[.\s\(\)\[\]-]')
 # 用于替换文件名中的分隔符的模式
 SEPARATOR_PATTERN = re.compile(r'[\s\(\)\[\]]')
 
+# 连续的点号
+MULTI_DOT_PATTERN = re.compile(r'\.{2,}')
+
+# 文件系统不兼容的特殊字符，统一替换为点号
+UNSAFE_CHAR_TABLE = str.maketrans(dict.fromkeys(':/\\|?*<>"', '.'))
+
+# 名称规整结果为空时，用于从原始名称中去除非字母数字和基本符号的字符
+NON_NAME_CHAR_PATTERN = re.compile(r'[^\w\-.]')
+
 
 def is_tv_show(filename):
     """
@@ -108,6 +133,7 @@ def match_resolution_and_codec(filename, target_resolution=None, target_codec=No
     return True
 
 
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def normalize_name(name):
     """
     统一的名称规整函数：用于文件名和目录名的标准化处理
@@ -122,18 +148,11 @@ def normalize_name(name):
     # 替换所有空格、()、[]为点号
     normalized = SEPARATOR_PATTERN.sub('.', name)
     
-    # 处理可能出现的连续点号
-    while '..' in normalized:
-        normalized = normalized.replace('..', '.')
-    
     # 替换文件系统不兼容的特殊字符
-    file_system_unsafe = [':', '/', '\\', '|', '?', '*', '<', '>', '"']
-    for char in file_system_unsafe:
-        normalized = normalized.replace(char, '.')
+    normalized = normalized.translate(UNSAFE_CHAR_TABLE)
     
-    # 再次处理可能因替换产生的连续点号
-    while '..' in normalized:
-        normalized = normalized.replace('..', '.')
+    # 一次合并两次替换产生的连续点号
+    normalized = MULTI_DOT_PATTERN.sub('.', normalized)
     
     # 去除开头和结尾的点号
     normalized = normalized.strip('.')
@@ -141,7 +160,7 @@ def normalize_name(name):
     # 如果结果为空，返回原始名称的简化版本
     if not normalized:
         # 只保留字母数字和基本符号
-        normalized = re.sub(r'[^\w\-.]', '', name)
+        normalized = NON_NAME_CHAR_PATTERN.sub('', name)
         if not normalized:
             normalized = "Unknown"
     
@@ -164,54 +183,41 @@ def extract_show_info(filename):
     # 标准化文件名（替换空格、()、[]为点号）
     normalized_basename = normalize_name(basename)
     
+    # 一次扫描记录季数和年份的首次匹配，两者都找到即可停止
+    first_matches = {}
+    for match in SHOW_INFO_PATTERN.finditer(normalized_basename):
+        first_matches.setdefault(match.lastgroup, match)
+        if len(first_matches) == len(SHOW_INFO_GROUPS):
+            break
+    
     # 提取季数
-    season_match = SEASON_PATTERN.search(normalized_basename)
+    season_match = first_matches.get('season')
     if not season_match:
-        logging.warning(f"无法从 {filename} 中提取季数")
+        logging.warning("无法从 %s 中提取季数", filename)
         return None, None
     
-    season_num = int(season_match.group(1))
+    season_num = int(season_match.group(SHOW_INFO_PATTERN.groupindex['season'] + 1))
     season_str = f"S{season_num:02d}"
     
     # 提取剧名（假设剧名在年份之前或季数之前）
-    year_match = YEAR_PATTERN.search(normalized_basename)
+    year_match = first_matches.get('year')
     
     if year_match:
         # 如果有年份，剧名在年份之前
-        show_name_parts = normalized_basename[:year_match.start()].split('.')
+        show_name_parts = normalized_basename[:year_match.start('year')].split('.')
     else:
         # 否则，剧名在季数之前
-        show_name_parts = normalized_basename[:season_match.start()].split('.')
+        show_name_parts = normalized_basename[:season_match.start('season')].split('.')
     
     # 清理剧名
     show_name = ' '.join(show_name_parts).strip()
     if not show_name:
-        logging.warning(f"无法从 {filename} 中提取剧名")
+        logging.warning("无法从 %s 中提取剧名", filename)
         return None, None
     
     return show_name, season_str
 
 
-def has_ai_subtitle(video_file_path):
-    """
-    检查视频文件是否存在对应的.ai.srt字幕文件
-    
-    Args:
-        video_file_path: 视频文件的完整路径
-        
-    Returns:
-        bool: 如果存在对应的.ai.srt字幕文件返回True，否则返回False
-    """
-    # 获取视频文件的目录和文件名（不含扩展名）
-    video_dir = os.path.dirname(video_file_path)
-    video_name = os.path.splitext(os.path.basename(video_file_path))[0]
-    
-    # 构造对应的.ai.srt字幕文件路径
-    ai_subtitle_path = os.path.join(video_dir, f"{video_name}.ai.srt")
-    
-    return os.path.exists(ai_subtitle_path)
-
-
 def check_directory_permissions(directory):
     """
     检查目录的读写权限
@@ -232,7 +238,36 @@ def check_directory_permissions(directory):
     return os.access(directory, os.R_OK | os.W_OK)
 
 
-def create_target_directory(base_dir, show_name, season):
+def ensure_directory(directory, known_dirs=None):
+    """
+    确保目录存在：直接尝试创建，已存在时忽略，不需要先检查目录是否存在
+    
+    Args:
+        directory: 目录路径
+        known_dirs: 已确认存在的目录集合（可选），集合中的目录不再访问文件系统，
+            确认后的目录会加入集合
+        
+    Returns:
+        bool: 是否新创建了目录
+        
+    Raises:
+        OSError: 无法创建目录
+    """
+    if known_dirs is not None and directory in known_dirs:
+        return False
+    
+    try:
+        os.makedirs(directory)
+        created = True
+    except FileExistsError:
+        created = False
+    
+    if known_dirs is not None:
+        known_dirs.add(directory)
+    return created
+
+
+def create_target_directory(base_dir, show_name, season, known_dirs=None):
     """
     创建目标目录结构
     
@@ -240,6 +275,7 @@ def create_target_directory(base_dir, show_name, season):
         base_dir: 基础目录
         show_name: 剧名
         season: 季数
+        known_dirs: 已确认存在的目录集合（可选），用于跳过重复的创建
         
     Returns:
         str: 创建的目标目录路径，如果创建失败返回None
@@ -247,31 +283,29 @@ def create_target_directory(base_dir, show_name, season):
     # 标准化剧名（将空格替换为点号）
     normalized_show_name = normalize_name(show_name)
     
-    # 创建剧名目录
+    # 创建剧名目录（同一部剧的每一集都会用到，已确认存在时不再访问文件系统）
     show_dir = os.path.join(base_dir, normalized_show_name)
-    if not os.path.exists(show_dir):
-        try:
-            os.makedirs(show_dir)
-            logging.info(f"创建剧名目录: {show_dir}")
-        except PermissionError:
-            logging.error(f"权限错误: 无法创建剧名目录 {show_dir}")
-            return None
-        except OSError as e:
-            logging.error(f"系统错误: 无法创建剧名目录 {show_dir}: {e}")
-            return None
+    try:
+        if ensure_directory(show_dir, known_dirs):
+            logging.info("创建剧名目录: %s", show_dir)
+    except PermissionError:
+        logging.error("权限错误: 无法创建剧名目录 %s", show_dir)
+        return None
+    except OSError as e:
+        logging.error("系统错误: 无法创建剧名目录 %s: %s", show_dir, e)
+        return None
     
     # 创建季目录
     season_dir = os.path.join(show_dir, season)
-    if not os.path.exists(season_dir):
-        try:
-            os.makedirs(season_dir)
-            logging.info(f"创建季目录: {season_dir}")
-        except PermissionError:
-            logging.error(f"权限错误: 无法创建季目录 {season_dir}")
-            return None
-        except OSError as e:
-            logging.error(f"系统错误: 无法创建季目录 {season_dir}: {e}")
-            return None
+    try:
+        if ensure_directory(season_dir, known_dirs):
+            logging.info("创建季目录: %s", season_dir)
+    except PermissionError:
+        logging.error("权限错误: 无法创建季目录 %s", season_dir)
+        return None
+    except OSError as e:
+        logging.error("系统错误: 无法创建季目录 %s: %s", season_dir, e)
+        return None
     
     return season_dir
 
@@ -286,23 +320,23 @@ def can_remove_directory(directory):
     Returns:
         bool: 是否可以删除目录
     """
-    # 检查目录是否存在
-    if not os.path.exists(directory) or not os.path.isdir(directory):
+    try:
+        # 文件类型直接取自目录项，不需要对每个文件单独调用 stat；
+        # 遇到第一个不能删除的文件即返回
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_file():
+                    _, ext = os.path.splitext(entry.name)
+                    if ext.lower() not in IGNORED_EXTENSIONS:
+                        return False
+    except (FileNotFoundError, NotADirectoryError):
+        # 目录不存在或不是目录时不能删除
+        return False
+    except OSError as e:
+        logging.warning("检查目录时出错: %s, 错误: %s", directory, e)
         return False
     
-    # 获取目录中的所有文件
-    files = [f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
-    
-    # 如果目录为空，可以删除
-    if not files:
-        return True
-    
-    # 检查是否只包含被忽略的文件类型
-    for file in files:
-        _, ext = os.path.splitext(file)
-        if ext.lower() not in IGNORED_EXTENSIONS:
-            return False
-    
+    # 目录为空或只包含被忽略的文件类型，可以删除
     return True
 
 
@@ -320,32 +354,33 @@ def move_file(source_path, target_dir, override_files=True):
     """
     filename = os.path.basename(source_path)
     
-    # 获取文件扩展名
-    _, ext = os.path.splitext(filename)
-    
-    # 标准化文件名（替换空格、()、[]为点号）
+    # 标准化文件名（替换空格、()、[]为点号），扩展名不受影响
     normalized_filename = normalize_name(filename)
     
-    # 保留原始扩展名
-    if normalized_filename.endswith(ext):
-        normalized_filename = normalized_filename[:-len(ext)] + ext
-    
     target_path = os.path.join(target_dir, normalized_filename)
     
     # 检查目标文件是否已存在
     if os.path.exists(target_path):
         if not override_files:
-            logging.warning(f"目标文件已存在，跳过: {target_path}")
+            logging.warning("目标文件已存在，跳过: %s", target_path)
             return False
         else:
-            logging.info(f"目标文件已存在，将覆盖: {target_path}")
+            logging.info("目标文件已存在，将覆盖: %s", target_path)
     
     try:
-        shutil.move(source_path, target_path)
-        logging.info(f"移动文件: {source_path} -> {target_path}")
+        try:
+            # 同一文件系统内直接原子重命名（覆盖已存在的文件）
+            os.replace(source_path, target_path)
+        except OSError as e:
+            # 目标目录位于其他文件系统时退回到复制后删除；
+            # 目标路径是已存在的目录时，与shutil.move一致，将文件移动到该目录中
+            if e.errno != errno.EXDEV and not os.path.isdir(target_path):
+                raise
+            shutil.move(source_path, target_path)
+        logging.info("移动文件: %s -> %s", source_path, target_path)
         return True
-    except Exception as e:
-        logging.error(f"移动文件失败: {source_path} -> {target_path}, 错误: {e}")
+    except OSError as e:
+        logging.error("移动文件失败: %s -> %s, 错误: %s", source_path, target_path, e)
         return False
 
 
@@ -370,100 +405,116 @@ def process_directory(source_dir, target_base_dir, resolution=None, codec=None,
     skipped_count = 0
     removed_dirs_count = 0
     
-    # 收集处理过的目录，用于后续检查是否可以删除
-    processed_dirs = set()
-    # 记录成功移动的视频文件，用于后续移动对应的字幕文件
-    moved_videos = {}  # {video_basename_without_ext: (target_dir, source_dir)}
-    
-    # 第一阶段：处理视频文件
-    for root, _, files in os.walk(source_dir, topdown=False):
+    # 按遍历顺序收集处理过的目录，用于后续检查是否可以删除
+    # 自顶向下遍历时父目录总在子目录之前，倒序即为先子后父的顺序
+    processed_dirs = []
+    # 遍历时跳过的隐藏目录，其中的文件没有被处理，包含它们的目录不能整个删除
+    pruned_dirs = []
+    # 已确认存在的目标目录，同一部剧的剧名和季目录只需创建一次
+    known_dirs = set()
+    # 没有指定分辨率和编码时所有文件都匹配，循环中不必逐个调用匹配函数
+    needs_filter = bool(resolution or codec)
+    
+    # 只遍历一次目录树，每个目录先处理视频文件，再处理同一目录中的字幕文件
+    for root, dirs, files in os.walk(source_dir, topdown=True, followlinks=False):
+        # 跳过隐藏目录（如NAS上的 .Trash、.@__thumb），其中不包含待整理的电视剧
+        hidden = [d for d in dirs if d.startswith('.')]
+        if hidden:
+            pruned_dirs.extend(os.path.join(root, d) for d in hidden)
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+        
+        # 记录当前目录中成功移动的视频文件，用于后续移动对应的字幕文件
+        moved_videos = {}  # {video_basename_without_ext: target_dir}
+        
+        # 当前目录的文件名集合，用于在内存中检查对应的.ai.srt字幕文件
+        dir_filenames = set(files)
+        
+        # 处理视频文件
         for filename in files:
-            # 检查文件扩展名是否为视频文件
-            _, ext = os.path.splitext(filename)
+            # 检查文件扩展名是否为视频文件，不含扩展名的文件名后续共用
+            video_basename, ext = os.path.splitext(filename)
             if ext.lower() not in VIDEO_EXTENSIONS:
                 continue
             
             # 检查是否为电视剧
             if not is_tv_show(filename):
-                logging.info(f"跳过电影文件: {filename}")
+                logging.info("跳过电影文件: %s", filename)
                 skipped_count += 1
                 continue
             
             # 检查是否匹配目标分辨率和编码
-            if not match_resolution_and_codec(filename, resolution, codec):
-                logging.info(f"跳过不匹配的文件: {filename}")
+            if needs_filter and not match_resolution_and_codec(filename, resolution, codec):
+                logging.info("跳过不匹配的文件: %s", filename)
                 skipped_count += 1
                 continue
             
             source_path = os.path.join(root, filename)
             
-            # 如果启用了AI字幕检查，检查是否存在对应的.ai.srt字幕文件
+            # 如果启用了AI字幕检查，在目录的文件名集合中检查是否存在对应的.ai.srt字幕文件
             if require_ai_subtitle:
-                if not has_ai_subtitle(source_path):
-                    logging.info(f"跳过文件: {filename} (未找到对应的.ai.srt字幕文件)")
+                if f"{video_basename}.ai.srt" not in dir_filenames:
+                    logging.info("跳过文件: %s (未找到对应的.ai.srt字幕文件)", filename)
                     skipped_count += 1
                     continue
             
             # 提取剧名和季数
             show_name, season = extract_show_info(filename)
             if not show_name or not season:
-                logging.warning(f"跳过文件: {filename} (无法提取信息)")
+                logging.warning("跳过文件: %s (无法提取信息)", filename)
                 failure_count += 1
                 continue
             
             # 创建目标目录
-            target_dir = create_target_directory(target_base_dir, show_name, season)
+            target_dir = create_target_directory(target_base_dir, show_name, season, known_dirs)
             if target_dir is None:
-                logging.error(f"跳过文件: {filename} (无法创建目标目录)")
+                logging.error("跳过文件: %s (无法创建目标目录)", filename)
                 failure_count += 1
                 continue
                 
-            logging.info(f"目标目录: {target_dir} (剧名: {show_name}, 季: {season})")
+            logging.info("目标目录: %s (剧名: %s, 季: %s)", target_dir, show_name, season)
             
             # 移动视频文件
             if move_file(source_path, target_dir, override_files):
                 success_count += 1
-                # 记录处理过的目录
-                processed_dirs.add(os.path.dirname(source_path))
                 # 记录成功移动的视频文件，用于后续移动字幕文件
-                video_basename = os.path.splitext(filename)[0]
-                moved_videos[video_basename] = (target_dir, root)
-                logging.info(f"成功移动视频文件: {filename}")
+                moved_videos[video_basename] = target_dir
+                logging.info("成功移动视频文件: %s", filename)
             else:
                 failure_count += 1
-    
-    # 第二阶段：处理字幕文件，只移动对应视频文件已成功移动的字幕文件
-    for root, _, files in os.walk(source_dir, topdown=False):
+        
+        # 处理字幕文件，只移动对应视频文件已成功移动的字幕文件
         for filename in files:
             # 检查文件扩展名是否为字幕文件
-            _, ext = os.path.splitext(filename)
+            subtitle_basename, ext = os.path.splitext(filename)
             if ext.lower() not in SUBTITLE_EXTENSIONS:
                 continue
             
             # 检查是否为电视剧
             if not is_tv_show(filename):
-                logging.info(f"跳过电影字幕文件: {filename}")
+                logging.info("跳过电影字幕文件: %s", filename)
                 skipped_count += 1
                 continue
             
             # 检查是否匹配目标分辨率和编码
-            if not match_resolution_and_codec(filename, resolution, codec):
-                logging.info(f"跳过不匹配的字幕文件: {filename}")
+            if needs_filter and not match_resolution_and_codec(filename, resolution, codec):
+                logging.info("跳过不匹配的字幕文件: %s", filename)
                 skipped_count += 1
                 continue
             
             source_path = os.path.join(root, filename)
-            subtitle_basename = os.path.splitext(filename)[0]
             
-            # 查找对应的视频文件是否已被移动
+            # 在同一目录已移动的视频中查找对应的视频文件，字幕名通常与视频名完全相同，先直接查找
             corresponding_video = None
-            for video_basename, (target_dir, video_root) in moved_videos.items():
-                if video_root == root and subtitle_basename.startswith(video_basename):
-                    corresponding_video = (target_dir, video_basename)
-                    break
+            if subtitle_basename in moved_videos:
+                corresponding_video = (moved_videos[subtitle_basename], subtitle_basename)
+            else:
+                for video_basename, target_dir in moved_videos.items():
+                    if subtitle_basename.startswith(video_basename):
+                        corresponding_video = (target_dir, video_basename)
+                        break
             
             if corresponding_video is None:
-                logging.info(f"跳过字幕文件: {filename} (对应的视频文件未被移动)")
+                logging.info("跳过字幕文件: %s (对应的视频文件未被移动)", filename)
                 skipped_count += 1
                 continue
             
@@ -472,25 +523,29 @@ def process_directory(source_dir, target_base_dir, resolution=None, codec=None,
             # 移动字幕文件
             if move_file(source_path, target_dir, override_files):
                 success_count += 1
-                # 记录处理过的目录
-                processed_dirs.add(os.path.dirname(source_path))
-                logging.info(f"成功移动字幕文件: {filename} (对应视频: {video_basename})")
+                logging.info("成功移动字幕文件: %s (对应视频: %s)", filename, video_basename)
             else:
                 failure_count += 1
+        
+        # 记录处理过的目录（字幕只会随已移动的视频移动，有视频移动即说明处理过）
+        if moved_videos:
+            processed_dirs.append(root)
     
     # 如果需要删除源目录
     if remove_source:
-        # 按照目录深度从深到浅排序，确保先删除子目录
-        sorted_dirs = sorted(processed_dirs, key=lambda x: x.count(os.sep), reverse=True)
-        
-        for dir_path in sorted_dirs:
+        # 按遍历顺序倒序检查，确保先删除子目录
+        for dir_path in reversed(processed_dirs):
+            prefix = os.path.join(dir_path, '')
+            if any(d.startswith(prefix) for d in pruned_dirs):
+                logging.info("保留源目录: %s (包含未处理的隐藏目录)", dir_path)
+                continue
             if can_remove_directory(dir_path):
                 try:
                     shutil.rmtree(dir_path)
-                    logging.info(f"删除源目录: {dir_path}")
+                    logging.info("删除源目录: %s", dir_path)
                     removed_dirs_count += 1
-                except Exception as e:
-                    logging.error(f"删除源目录失败: {dir_path}, 错误: {e}")
+                except OSError as e:
+                    logging.error("删除源目录失败: %s, 错误: %s", dir_path, e)
     
     return success_count, failure_count, skipped_count, removed_dirs_count
 
@@ -519,12 +574,10 @@ def main():
     
     # 检查源目录和目标目录是否存在
     if not os.path.isdir(source_dir):
-        print(f"错误: 源目录不存在: {source_dir}")
-        sys.exit(1)
+        parser.error(f"源目录不存在: {source_dir}")
     
     if not os.path.isdir(target_dir):
-        print(f"错误: 目标目录不存在: {target_dir}")
-        sys.exit(1)
+        parser.error(f"目标目录不存在: {target_dir}")
     
     # 检查目标目录权限
     if not check_directory_permissions(target_dir):
@@ -545,7 +598,7 @@ def main():
     if not override_files:
         filter_info += f", 覆盖文件 = 否"
     
-    logging.info(f"mv2tvdir v{__version__} - 开始处理: 源目录 = {source_dir}, 目标目录 = {target_dir}{filter_info}")
+    logging.info("mv2tvdir v%s - 开始处理: 源目录 = %s, 目标目录 = %s%s", __version__, source_dir, target_dir, filter_info)
     
     # 处理目录
     success_count, failure_count, skipped_count, removed_dirs_count = process_directory(
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+mv2tvdir 的单元测试
+
+运行：python3 -m unittest test_mv2tvdir（在本目录下），或 python3 -m pytest
+"""
+
+import os
+import sys
+import shutil
+import logging
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mv2tvdir import process_directory
+
+
+def touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(os.path.basename(path))
+
+
+class RemoveSourceTest(unittest.TestCase):
+    """--remove-source 不能删除遍历时跳过的内容"""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.tmp = tempfile.mkdtemp(prefix='mv2tvdir_test_')
+        self.source = os.path.join(self.tmp, 'src')
+        self.target = os.path.join(self.tmp, 'tgt')
+        os.makedirs(self.target)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        shutil.rmtree(self.tmp)
+
+    def test_keeps_directory_with_hidden_subdirectory(self):
+        show = os.path.join(self.source, 'Show')
+        hidden = os.path.join(show, '.extras')
+        for name in ('Show.S01E01.1080p.mkv', 'Show.S01E01.1080p.ai.srt'):
+            touch(os.path.join(show, name))
+        for name in ('Show.S01E02.1080p.mkv', 'Show.S01E02.1080p.ai.srt'):
+            touch(os.path.join(hidden, name))
+
+        process_directory(self.source, self.target, remove_source=True)
+
+        self.assertTrue(os.path.isfile(os.path.join(self.target, 'Show', 'S01', 'Show.S01E01.1080p.mkv')))
+        self.assertTrue(os.path.isfile(os.path.join(hidden, 'Show.S01E02.1080p.mkv')))
+        self.assertTrue(os.path.isfile(os.path.join(hidden, 'Show.S01E02.1080p.ai.srt')))
+
+    def test_removes_directory_without_hidden_subdirectory(self):
+        show = os.path.join(self.source, 'Show')
+        for name in ('Show.S01E01.1080p.mkv', 'Show.S01E01.1080p.ai.srt', 'info.nfo'):
+            touch(os.path.join(show, name))
+
+        process_directory(self.source, self.target, remove_source=True)
+
+        self.assertFalse(os.path.exists(show))
+
+
+if __name__ == '__main__':
+    unittest.main()